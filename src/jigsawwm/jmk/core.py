@@ -9,7 +9,7 @@ from dataclasses import dataclass, field
 from functools import partial
 from threading import Lock
 
-from jigsawwm.w32.vk import Vk, parse_combination, expand_combination
+from jigsawwm.w32.vk import Vk, parse_combination, expanded_combinations
 from jigsawwm.w32.sendinput import send_combination
 
 
@@ -112,12 +112,14 @@ class JmkTriggers(JmkHandler):
     def check_comb(self, comb: typing.List[Vk]):
         """Check if a combination is valid."""
 
-    def expand_comb(self, comb: JmkCombination) -> typing.List[typing.List[Vk]]:
-        """Expand a combination to a list of combinations."""
+    def expand_comb(
+        self, comb: JmkCombination
+    ) -> typing.FrozenSet[typing.Tuple[Vk, ...]]:
+        """Expand a combination to a set of combinations."""
         if isinstance(comb, str):
             comb = parse_combination(comb)
         self.check_comb(comb)
-        return expand_combination(comb)
+        return expanded_combinations(comb)
 
     def register_triggers(
         self,
@@ -186,7 +188,7 @@ class JmkKey(JmkLayerKey):
     ):
         super().__init__()
         if isinstance(keys_or_func, str):
-            keys_or_func = parse_combination(keys_or_func)
+            keys_or_func = list(parse_combination(keys_or_func))
         if isinstance(keys_or_func, Vk):
             keys_or_func = [keys_or_func]
         self.keys_or_func = keys_or_func
@@ -1,14 +1,13 @@
 """System input/output interfacing"""
 
 import logging
-import re
 from ctypes.wintypes import DWORD, HWND, LONG
 from typing import Callable, Dict, List, Optional, Set, Union
 
 from jigsawwm.ui import system_event_listener
 from jigsawwm.w32 import hook
 from jigsawwm.w32.sendinput import is_synthesized, send_input, vk_to_input
-from jigsawwm.w32.vk import Vk, is_key_down
+from jigsawwm.w32.vk import Vk, is_keys_down, vk_from_code
 from jigsawwm.w32.window_detector import Window, WindowDetector
 from jigsawwm.worker import ThreadWorker
 
@@ -23,9 +22,9 @@ JMK_MSG_CALL = 1
 class SystemInput(ThreadWorker, JmkHandler):
     """A handler that handles system input events.
 
-    :param bypass_exe: a list of regular expression patterns that matches the exe path
-        some applications (e.g. Windows 10's touch keyboard, emoji input) will not
-        work properly, so we need to bypass them
+    :param bypass_exe: executable names (case-insensitive, i.e. ``Snipaste.exe``) to
+        bypass, some applications (e.g. Windows 10's touch keyboard, emoji input) will
+        not work properly, so we need to bypass them
     """
 
     hook_handles: List[hook.HHOOK] = None
@@ -40,16 +39,17 @@ class SystemInput(ThreadWorker, JmkHandler):
 
     def __init__(
         self,
-        bypass_exe: Set[re.Pattern] = None,
+        bypass_exe: Set[str] = None,
         window_cache: WindowDetector = None,
     ):
+        # lowercased to match `Window.exe_name_lower`
         self.bypass_exe = {
-            "Snipaste.exe",
-            "TextInputHost.exe",
+            "snipaste.exe",
+            "textinputhost.exe",
             "vmplayer.exe",
         }
         if bypass_exe:
-            self.bypass_exe |= bypass_exe
+            self.bypass_exe |= {exe.lower() for exe in bypass_exe}
         self.pressed_evts = {}
         self.window_detector = window_cache or WindowDetector()
         system_event_listener.on_system_resumed.connect(self.on_system_resumed)
@@ -98,7 +98,7 @@ class SystemInput(ThreadWorker, JmkHandler):
             self.disabled = True
             self.disabled_reason = "elevated window focused"
             return
-        if self.bypass_exe and window.exe_name.lower() in self.bypass_exe:
+        if self.bypass_exe and window.exe_name_lower in self.bypass_exe:
             logger.info("focused window %s is blacklisted", window)
             self.disabled = True
             return
@@ -124,7 +124,7 @@ class SystemInput(ThreadWorker, JmkHandler):
         # convert keyboard/mouse event to a unified virtual key representation
         vkey, pressed = None, None
         if isinstance(msgid, hook.KBDLLHOOKMSGID):
-            vkey = Vk(msg.vkCode)
+            vkey = vk_from_code(msg.vkCode)
             if vkey == Vk.PACKET:
                 return False
             # if msg.flags & 0b10000:  # skip injected events
@@ -205,8 +205,8 @@ class SystemInput(ThreadWorker, JmkHandler):
 
     def fix_release(self):
         """Fix the release event of a key that was missed"""
-        for pk in list(self.pressed_evts.keys()):
-            if not is_key_down(pk):
+        for pk, down in is_keys_down(list(self.pressed_evts.keys())).items():
+            if not down:
                 logger.info("fixing release of %s", pk.name)
                 # pevt = self.pressed_evts[pk]
                 # self.on_input(pk, False, flags=pevt.flags, extra=pevt.extra)
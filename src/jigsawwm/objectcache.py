@@ -35,14 +35,18 @@ class ObjectCache(ThreadWorker):
 
     def get(self, key: Any) -> Any:
         """Get a object from the cache"""
-        if key not in self.cache:
-            created = False
-            with self._lock:
-                if key not in self.cache:
-                    self.cache[key] = self._create(key)
-                    created = True
-            if created:
-                self._created(self.cache[key])
+        # hits are by far the common case, look them up only once
+        try:
+            return self.cache[key]
+        except KeyError:
+            pass
+        created = False
+        with self._lock:
+            if key not in self.cache:
+                self.cache[key] = self._create(key)
+                created = True
+        if created:
+            self._created(self.cache[key])
         return self.cache[key]
 
     @abc.abstractmethod
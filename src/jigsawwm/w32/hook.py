@@ -54,6 +54,11 @@ user32.CallNextHookEx.argtypes = (
     WPARAM,  # _In_     wParam
     LPARAM,
 )  # _In_     lParam
+# called for every input event, skip the attribute lookup on the dll
+CallNextHookEx = user32.CallNextHookEx
+
+user32.UnhookWindowsHookEx.argtypes = (HHOOK,)
+user32.UnhookWindowsHookEx.restype = BOOL
 
 user32.GetMessageW.argtypes = (
     LPMSG,  # _Out_    lpMsg
@@ -65,7 +70,21 @@ user32.GetMessageW.argtypes = (
 user32.TranslateMessage.argtypes = (LPMSG,)
 user32.DispatchMessageW.argtypes = (LPMSG,)
 
+user32.RegisterWindowMessageW.argtypes = (LPCWSTR,)
+user32.RegisterWindowMessageW.restype = UINT
+
 user32.SetWinEventHook.restype = HWINEVENTHOOK
+user32.SetWinEventHook.argtypes = (
+    DWORD,  # _In_ eventMin
+    DWORD,  # _In_ eventMax
+    HMODULE,  # _In_ hmodWinEventProc
+    WINEVENTHOOKPROC,  # _In_ pfnWinEventProc
+    DWORD,  # _In_ idProcess
+    DWORD,  # _In_ idThread
+    DWORD,
+)  # _In_ dwFlags
+user32.UnhookWinEvent.argtypes = (HWINEVENTHOOK,)
+user32.UnhookWinEvent.restype = BOOL
 
 # keyboard hook definition
 
@@ -167,10 +186,11 @@ def hook(
         if n_code is None or nCode == n_code:
             ncode = n_code_type(nCode)
             wparam = wparam_type(wParam)
-            lparam = cast(lParam, POINTER(lparam_type))[0]
+            # view the struct in place, same as cast(...)[0] without the pointer object
+            lparam = lparam_type.from_address(lParam)
             if cb(ncode, wparam, lparam):
                 return 1
-        return user32.CallNextHookEx(None, nCode, wParam, lParam)
+        return CallNextHookEx(None, nCode, wParam, lParam)
 
     handle = user32.SetWindowsHookExW(hook_id, proc, None, 0)
     # keep a reference to the callback to prevent it from being garbage collected
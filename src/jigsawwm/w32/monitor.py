@@ -3,15 +3,16 @@
 import enum
 import math
 import sys
+import threading
 from ctypes import (
     WinDLL,
     WinError,
-    pointer,
     get_last_error,
     WINFUNCTYPE,
     byref,
     Structure,
     sizeof,
+    POINTER,
 )
 from ctypes.wintypes import (
     POINT,
@@ -25,8 +26,11 @@ from ctypes.wintypes import (
     RECT,
     DWORD,
     CHAR,
+    LONG,
+    LPPOINT,
+    INT,
 )
-from functools import cached_property
+from functools import partial
 from typing import Tuple, Set
 from dataclasses import dataclass
 import screeninfo
@@ -34,8 +38,72 @@ import screeninfo
 from .window_structs import Rect
 
 user32 = WinDLL("user32", use_last_error=True)
-shcore = WinDLL("shcore", use_last_error=True)
 _current_pos_ptr = POINT()
+_current_pos_byref = byref(_current_pos_ptr)
+_monitor_info_local = threading.local()
+
+CCHDEVICENAME = 32
+
+
+class MONITORINFO(Structure):
+    """Contains information about a display monitor"""
+
+    cbSize: int
+    rcMonitor: RECT
+    rcWork: RECT
+    dwFlags: int
+
+    _fields_ = (
+        ("cbSize", DWORD),
+        ("rcMonitor", RECT),
+        ("rcWork", RECT),
+        ("dwFlags", DWORD),
+    )
+
+
+class MONITORINFOEX(MONITORINFO):
+    """Contains information about a display monitor, including its device name"""
+
+    szDevice: CHAR
+
+    _fields_ = (("szDevice", CHAR * CCHDEVICENAME),)
+
+
+MONITORENUMPROC = WINFUNCTYPE(BOOL, HMONITOR, HDC, LPRECT, LPARAM)
+
+# bind the function pointers once so the calls skip the WinDLL attribute lookup
+# and the default argument conversion
+GetCursorPos = user32.GetCursorPos
+GetCursorPos.argtypes = (LPPOINT,)
+GetCursorPos.restype = BOOL
+SetCursorPos = user32.SetCursorPos
+SetCursorPos.argtypes = (INT, INT)
+SetCursorPos.restype = BOOL
+EnumDisplayMonitors = user32.EnumDisplayMonitors
+EnumDisplayMonitors.argtypes = (HDC, LPRECT, MONITORENUMPROC, LPARAM)
+EnumDisplayMonitors.restype = BOOL
+MonitorFromPoint = user32.MonitorFromPoint
+MonitorFromPoint.argtypes = (POINT, DWORD)
+MonitorFromPoint.restype = HMONITOR
+MonitorFromWindow = user32.MonitorFromWindow
+MonitorFromWindow.argtypes = (HWND, DWORD)
+MonitorFromWindow.restype = HMONITOR
+GetMonitorInfoA = user32.GetMonitorInfoA
+GetMonitorInfoA.argtypes = (HMONITOR, POINTER(MONITORINFO))
+GetMonitorInfoA.restype = BOOL
+_shcore = None
+
+
+def _load_shcore() -> WinDLL:
+    """Loads shcore on first use, it is only needed for the scale factor"""
+    global _shcore  # pylint: disable=global-statement
+    if _shcore is None:
+        dll = WinDLL("shcore", use_last_error=True)
+        dll.GetScaleFactorForMonitor.argtypes = (HMONITOR, POINTER(ULONG))
+        dll.GetScaleFactorForMonitor.restype = LONG
+        _shcore = dll
+    return _shcore
+
 
 # Ref: https://learn.microsoft.com/en-us/windows/win32/gdi/multiple-display-monitors-functions
 
@@ -46,7 +114,7 @@ def get_cursor_pos() -> POINT:
     :return: mouse position
     :rtype: POINT
     """
-    if not user32.GetCursorPos(pointer(_current_pos_ptr)):
+    if not GetCursorPos(_current_pos_byref):
         raise WinError(get_last_error())
     return _current_pos_ptr
 
@@ -57,31 +125,37 @@ def set_cursor_pos(x: int, y: int):
     :param x: int
     :param y: int
     """
-    if not user32.SetCursorPos(int(x), int(y)):
+    if not SetCursorPos(int(x), int(y)):
         raise WinError(get_last_error())
 
 
+_enumerated_hmons: Set[HMONITOR] = set()
+_enum_display_monitors_lock = threading.Lock()
+
+
+@MONITORENUMPROC
+def _monitor_enum_proc(
+    hmon: HMONITOR,
+    _hdc: HDC,
+    _lprc: LPRECT,
+    _lparam: LPARAM,
+) -> BOOL:
+    _enumerated_hmons.add(hmon)
+    return True
+
+
 def enum_display_monitors() -> Set[HMONITOR]:
     """Returns a List of all monitors. THIS DO NOT RETURN MIRRORING MONITORS
 
     :return: list of monitor handles
     :rtype: List[]
     """
-    hmons = set()
-
-    @WINFUNCTYPE(BOOL, HMONITOR, HDC, LPRECT, LPARAM)
-    def monitor_enum_proc(
-        hmon: HMONITOR,
-        _hdc: HDC,
-        _lprc: LPRECT,
-        _lparam: LPARAM,
-    ) -> BOOL:
-        hmons.add(hmon)
-        return True
-
-    if not user32.EnumDisplayMonitors(None, None, monitor_enum_proc, None):
-        raise WinError(get_last_error())
-    return hmons
+    # the callback is created once and collects into a shared set
+    with _enum_display_monitors_lock:
+        _enumerated_hmons.clear()
+        if not EnumDisplayMonitors(None, None, _monitor_enum_proc, 0):
+            raise WinError(get_last_error())
+        return set(_enumerated_hmons)
 
 
 def monitor_from_point(x: int, y: int) -> HMONITOR:
@@ -92,7 +166,9 @@ def monitor_from_point(x: int, y: int) -> HMONITOR:
     :returns: monitor handle
     :rtype: HMONITOR
     """
-    return user32.MonitorFromPoint(POINT(x=x, y=y), 0)
+    # a POINT per call, it is passed by value and the function is called from
+    # several threads
+    return MonitorFromPoint(POINT(x, y), 0)
 
 
 def monitor_from_window(hwnd: HWND) -> HMONITOR:
@@ -102,7 +178,7 @@ def monitor_from_window(hwnd: HWND) -> HMONITOR:
     :returns: monitor handle
     :rtype: HMONITOR
     """
-    return user32.MonitorFromWindow(hwnd, 0)
+    return MonitorFromWindow(hwnd, 0)
 
 
 def monitor_from_cursor() -> HMONITOR:
@@ -111,29 +187,7 @@ def monitor_from_cursor() -> HMONITOR:
     :returns: monitor handle
     :rtype: HMONITOR
     """
-    pt = get_cursor_pos()
-    return monitor_from_point(pt.x, pt.y)
-
-
-CCHDEVICENAME = 32
-
-
-class MONITORINFOEX(Structure):
-    """Contains information about a display monitor"""
-
-    cbSize: int
-    rcMonitor: RECT
-    rcWork: RECT
-    dwFlags: int
-    szDevice: CHAR
-
-    _fields_ = (
-        ("cbSize", DWORD),
-        ("rcMonitor", RECT),
-        ("rcWork", RECT),
-        ("dwFlags", DWORD),
-        ("szDevice", CHAR * CCHDEVICENAME),
-    )
+    return MonitorFromPoint(get_cursor_pos(), 0)
 
 
 class DeviceScaleFactor(enum.IntEnum):
@@ -177,25 +231,34 @@ class Monitor:
     :param hmon: HMONITOR the monitor handle
     """
 
-    handle: HMONITOR
+    __slots__ = ("handle", "_name", "_get_monitor_info", "_get_scale_factor")
+
+    handle: int
 
     def __init__(self, hmon: HMONITOR):
-        self.handle = hmon
+        # unbox ctypes handles once so hashing and comparison stay on plain ints
+        self.handle = getattr(hmon, "value", hmon) or 0
+        self._name = None
+        # monitors are long-lived, bake the handle into the calls made on them
+        self._get_monitor_info = partial(GetMonitorInfoA, self.handle)
+        self._get_scale_factor = None
 
     def __eq__(self, other):
-        return isinstance(other, Monitor) and self.handle == other.handle
+        return type(other) is Monitor and self.handle == other.handle
 
     def __hash__(self):
-        return hash(self.handle)
+        return self.handle
 
     def __repr__(self):
         rect = self.get_work_rect()
         return f"<Monitor hmon={self.handle} name={self.name} rect={rect} scale={self.get_scale_factor()/100}>"
 
-    @cached_property
+    @property
     def name(self) -> str:
         """Retrieves monitor name"""
-        return self.get_info().szDevice.decode("utf-8")
+        if self._name is None:
+            self._name = self.get_info().szDevice.decode("utf-8")
+        return self._name
 
     def get_rect(self) -> Rect:
         """Retrieves monitor rectangle
@@ -203,7 +266,7 @@ class Monitor:
         :returns: monitor rectangle
         :rtype: Rect
         """
-        info = self.get_info()
+        info = self.get_basic_info()
         if not info:
             return None
         return Rect.from_win_rect(info.rcMonitor)
@@ -214,20 +277,43 @@ class Monitor:
         :returns: monitor rectangle
         :rtype: Rect
         """
-        info = self.get_info()
+        info = self.get_basic_info()
         if not info:
             return None
         return Rect.from_win_rect(info.rcWork)
 
+    def get_basic_info(self) -> MONITORINFO:
+        """Retrieves monitor information without the device name, cheaper than
+        `get_info` when only the rectangles are needed
+
+        The returned structure is a per-thread buffer shared by all monitors, it is
+        overwritten by the next call on the same thread, copy out what you need.
+
+        :returns: monitor information
+        :rtype: MONITORINFO
+        """
+        monitor_info = getattr(_monitor_info_local, "basic_buff", None)
+        if monitor_info is None:
+            monitor_info = _monitor_info_local.basic_buff = MONITORINFO()
+            monitor_info.cbSize = sizeof(monitor_info)  # pylint: disable=invalid-name
+        if not self._get_monitor_info(byref(monitor_info)):
+            return None
+        return monitor_info
+
     def get_info(self) -> MONITORINFOEX:
         """Retrieves monitor information
 
+        The returned structure is a per-thread buffer shared by all monitors, it is
+        overwritten by the next call on the same thread, copy out what you need.
+
         :returns: monitor information
         :rtype: MONITORINFOEX
         """
-        monitor_info = MONITORINFOEX()
-        monitor_info.cbSize = sizeof(monitor_info)  # pylint: disable=invalid-name
-        if not user32.GetMonitorInfoA(self.handle, pointer(monitor_info)):
+        monitor_info = getattr(_monitor_info_local, "buff", None)
+        if monitor_info is None:
+            monitor_info = _monitor_info_local.buff = MONITORINFOEX()
+            monitor_info.cbSize = sizeof(monitor_info)  # pylint: disable=invalid-name
+        if not self._get_monitor_info(byref(monitor_info)):
             return None
         return monitor_info
 
@@ -237,8 +323,12 @@ class Monitor:
         :returns: scale factor
         :rtype: DEVICE_SCALE_FACTOR
         """
+        if self._get_scale_factor is None:
+            self._get_scale_factor = partial(
+                _load_shcore().GetScaleFactorForMonitor, self.handle
+            )
         scale_factor = ULONG()
-        if shcore.GetScaleFactorForMonitor(self.handle, byref(scale_factor)) != 0:
+        if self._get_scale_factor(byref(scale_factor)) != 0:
             raise WinError(get_last_error())
         return DeviceScaleFactor(scale_factor.value)
 
@@ -260,10 +350,10 @@ class Monitor:
 
     def get_monitor_central(self) -> Tuple[int, int]:
         """Retrieves coordinates of the center of specified monitor"""
-        rect = self.get_info().rcMonitor
+        rect = self.get_basic_info().rcMonitor
         return (
-            rect.left + (rect.right - rect.left) / 2,
-            rect.top + (rect.bottom - rect.top) / 2,
+            (rect.left + rect.right) // 2,
+            (rect.top + rect.bottom) // 2,
         )
 
     def inspect(self, file=sys.stdout):
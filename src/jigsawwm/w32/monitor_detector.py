@@ -57,16 +57,15 @@ class MonitorDetector(ObjectCache, ChangeDetector):
         """Detect changes since the previous detection"""
         changed, new_keys, removed_keys = self.detect_changes()
         if changed:
-            self.monitors = sorted(
-                map(self.get_monitor, self.previous_keys),
-                # key=lambda m: m.get_monitor_central(),
-                key=lambda m: m.name,
-            )
+            monitors = [self.get_monitor(k) for k in self.previous_keys]
+            # monitors.sort(key=lambda m: m.get_monitor_central())
+            monitors.sort(key=lambda m: m.name)
+            self.monitors = monitors
             self.refresh_full_rect()
         return MonitorsChange(
             changed,
-            set(map(self.get_monitor, new_keys)),
-            set(map(self.get_monitor, removed_keys)),
+            {self.get_monitor(k) for k in new_keys} if new_keys else set(),
+            {self.get_monitor(k) for k in removed_keys} if removed_keys else set(),
         )
 
     def monitor_from_point(self, x: int, y: int) -> Monitor:
@@ -87,10 +86,21 @@ class MonitorDetector(ObjectCache, ChangeDetector):
 
     def refresh_full_rect(self) -> Rect:
         """Refresh the full rect of all monitors"""
-        rects = [m.get_rect() for m in self.monitors]
-        left = min(r.left for r in rects)
-        top = min(r.top for r in rects)
-        right = max(r.right for r in rects)
-        bottom = max(r.bottom for r in rects)
+        rects = (m.get_rect() for m in self.monitors)
+        r = next(rects, None)
+        if r is None:
+            # no monitor at all for a moment, i.e. while displays are reconfigured
+            self.full_rect = Rect(0, 0, 0, 0)
+            return self.full_rect
+        left, top, right, bottom = r.left, r.top, r.right, r.bottom
+        for r in rects:
+            if r.left < left:
+                left = r.left
+            if r.top < top:
+                top = r.top
+            if r.right > right:
+                right = r.right
+            if r.bottom > bottom:
+                bottom = r.bottom
         self.full_rect = Rect(left, top, right, bottom)
         return self.full_rect
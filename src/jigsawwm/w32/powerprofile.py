@@ -3,8 +3,12 @@ from ctypes.wintypes import *  # pylint: disable=wildcard-import,unused-wildcard
 
 powrprof = WinDLL("powrprof", use_last_error=True)
 
+SetSuspendState = powrprof.SetSuspendState
+SetSuspendState.argtypes = (BOOLEAN, BOOLEAN, BOOLEAN)
+SetSuspendState.restype = BOOLEAN
+
 
 def suspend_system() -> None:
     """Suspends the system."""
-    if not powrprof.SetSuspendState(False, False, False):
+    if not SetSuspendState(False, False, False):
         raise WinError(get_last_error())
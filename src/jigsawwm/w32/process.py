@@ -2,17 +2,101 @@
 import os
 from ctypes import * # pylint: disable=wildcard-import,unused-wildcard-import
 from ctypes.wintypes import * # pylint: disable=wildcard-import,unused-wildcard-import
-from typing import List
+from typing import Dict, List, Iterable, Iterator, Set, Tuple
 from enum import IntEnum
+from threading import Lock
 
 kernel32 = WinDLL("kernel32", use_last_error=True)
 advapi32 = WinDLL("advapi32", use_last_error=True)
-psapi = WinDLL("psapi", use_last_error=True)
-shcore  = WinDLL("shcore", use_last_error=True)
 
 TOKEN_QUERY = DWORD(8)
 PROCESS_QUERY_LIMITED_INFORMATION = DWORD(0x1000)
 TOKEN_ELEVATION = INT(20)
+TH32CS_SNAPPROCESS = DWORD(0x2)
+INVALID_HANDLE_VALUE = HANDLE(-1).value
+_proc_buff = (DWORD * 1024)()
+_proc_buff_lock = Lock()
+_session_id = DWORD()
+# pid -> (creation time, (exe path, elevated)), the creation time tells a reused pid
+_process_info: Dict[int, Tuple[int, Tuple[str, bool]]] = {}
+_PROCESS_INFO_CACHE_SIZE = 1024
+
+
+class PROCESSENTRY32W(Structure):
+    """Describes an entry from a list of the processes residing in the system address space
+
+    Ref: https://learn.microsoft.com/en-us/windows/win32/api/tlhelp32/ns-tlhelp32-processentry32w
+    """
+
+    _fields_ = (
+        ("dwSize", DWORD),
+        ("cntUsage", DWORD),
+        ("th32ProcessID", DWORD),
+        ("th32DefaultHeapID", c_size_t),
+        ("th32ModuleID", DWORD),
+        ("cntThreads", DWORD),
+        ("th32ParentProcessID", DWORD),
+        ("pcPriClassBase", LONG),
+        ("dwFlags", DWORD),
+        ("szExeFile", WCHAR * MAX_PATH),
+    )
+
+
+# bind the function pointers once so the calls skip the WinDLL attribute lookup
+# and the default argument conversion
+OpenProcess = kernel32.OpenProcess
+OpenProcess.argtypes = (DWORD, BOOL, DWORD)
+OpenProcess.restype = HANDLE
+CloseHandle = kernel32.CloseHandle
+CloseHandle.argtypes = (HANDLE,)
+CloseHandle.restype = BOOL
+QueryFullProcessImageNameW = kernel32.QueryFullProcessImageNameW
+QueryFullProcessImageNameW.argtypes = (HANDLE, DWORD, LPWSTR, PDWORD)
+QueryFullProcessImageNameW.restype = BOOL
+GetProcessTimes = kernel32.GetProcessTimes
+GetProcessTimes.argtypes = (HANDLE, LPFILETIME, LPFILETIME, LPFILETIME, LPFILETIME)
+GetProcessTimes.restype = BOOL
+GetCurrentProcessId = kernel32.GetCurrentProcessId
+GetCurrentProcessId.argtypes = ()
+GetCurrentProcessId.restype = DWORD
+ProcessIdToSessionId = kernel32.ProcessIdToSessionId
+ProcessIdToSessionId.argtypes = (DWORD, PDWORD)
+ProcessIdToSessionId.restype = BOOL
+WTSGetActiveConsoleSessionId = kernel32.WTSGetActiveConsoleSessionId
+WTSGetActiveConsoleSessionId.argtypes = ()
+WTSGetActiveConsoleSessionId.restype = DWORD
+OpenProcessToken = advapi32.OpenProcessToken
+OpenProcessToken.argtypes = (HANDLE, DWORD, PHANDLE)
+OpenProcessToken.restype = BOOL
+GetTokenInformation = advapi32.GetTokenInformation
+GetTokenInformation.argtypes = (HANDLE, INT, LPVOID, DWORD, PDWORD)
+GetTokenInformation.restype = BOOL
+# K32EnumProcesses is what psapi!EnumProcesses forwards to, no need to load psapi
+EnumProcesses = kernel32.K32EnumProcesses
+EnumProcesses.argtypes = (PDWORD, DWORD, PDWORD)
+EnumProcesses.restype = BOOL
+CreateToolhelp32Snapshot = kernel32.CreateToolhelp32Snapshot
+CreateToolhelp32Snapshot.argtypes = (DWORD, DWORD)
+CreateToolhelp32Snapshot.restype = HANDLE
+Process32FirstW = kernel32.Process32FirstW
+Process32FirstW.argtypes = (HANDLE, POINTER(PROCESSENTRY32W))
+Process32FirstW.restype = BOOL
+Process32NextW = kernel32.Process32NextW
+Process32NextW.argtypes = (HANDLE, POINTER(PROCESSENTRY32W))
+Process32NextW.restype = BOOL
+_shcore = None
+
+
+def _load_shcore() -> WinDLL:
+    """Loads shcore on first use, it is only needed for the DPI awareness"""
+    global _shcore  # pylint: disable=global-statement
+    if _shcore is None:
+        dll = WinDLL("shcore", use_last_error=True)
+        dll.GetProcessDpiAwareness.argtypes = (HANDLE, POINTER(INT))
+        dll.GetProcessDpiAwareness.restype = LONG
+        _shcore = dll
+    return _shcore
+
 
 def open_process_for_limited_query(pid: int) -> HANDLE:
     """Opens an existing local process object with permission to query limited information
@@ -23,12 +107,54 @@ def open_process_for_limited_query(pid: int) -> HANDLE:
     :return:  process handle
     :rtype: HANDLE
     """
-    hprc = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    hprc = OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
     if not hprc:
         raise WinError(get_last_error())
     return hprc
 
 
+def _query_elevation(hprc: HANDLE) -> bool:
+    """Check if the opened process is elevated"""
+    htoken = HANDLE()
+    try:
+        if not OpenProcessToken(hprc, TOKEN_QUERY, byref(htoken)):
+            return False
+        result = BOOL()
+        returned_length = DWORD()
+        if not GetTokenInformation(
+            htoken,
+            TOKEN_ELEVATION,
+            byref(result),
+            sizeof(result),
+            byref(returned_length),
+        ):
+            raise WinError(get_last_error())
+        return bool(result.value)
+    finally:
+        if htoken:
+            CloseHandle(htoken)
+
+
+def _query_exepath(hprc: HANDLE) -> str:
+    """Retrieves the full path of the executable of the opened process"""
+    buff = create_unicode_buffer(512)
+    # the size is in characters, not bytes
+    size = DWORD(len(buff))
+    if not QueryFullProcessImageNameW(hprc, 0, buff, byref(size)):
+        raise WinError(get_last_error())
+    return buff.value
+
+
+def _query_creation_time(hprc: HANDLE) -> int:
+    """Retrieves the creation time of the opened process, 0 if unavailable"""
+    creation, exit_, kernel, user = FILETIME(), FILETIME(), FILETIME(), FILETIME()
+    if not GetProcessTimes(
+        hprc, byref(creation), byref(exit_), byref(kernel), byref(user)
+    ):
+        return 0
+    return creation.dwHighDateTime << 32 | creation.dwLowDateTime
+
+
 def is_elevated(pid: int) -> bool:
     """Check if specified process is elevated (run in Administrator Role)
 
@@ -36,28 +162,14 @@ def is_elevated(pid: int) -> bool:
     :return: `True` if elevated, `False` otherwise
     :rtype: bool
     """
-    hprc = None
     try:
         hprc = open_process_for_limited_query(pid)
     except OSError:
         return True
-    htoken = PHANDLE()
-    if not windll.advapi32.OpenProcessToken(hprc, TOKEN_QUERY, byref(htoken)):
-        windll.kernel32.CloseHandle(hprc)
-        return
-    result = BOOL()
-    returned_length = DWORD()
-    if not advapi32.GetTokenInformation(
-        htoken,
-        TOKEN_ELEVATION,
-        byref(result),
-        4,
-        byref(returned_length),
-    ):
-        raise WinError(get_last_error())
-    kernel32.CloseHandle(hprc)
-    kernel32.CloseHandle(htoken)
-    return bool(result.value)
+    try:
+        return _query_elevation(hprc)
+    finally:
+        CloseHandle(hprc)
 
 
 def get_exepath(pid: int) -> str:
@@ -73,28 +185,133 @@ def get_exepath(pid: int) -> str:
         hprc = open_process_for_limited_query(pid)
     except OSError:
         return ""
-    buff = create_unicode_buffer(512)
-    size = DWORD(sizeof(buff))
-    if not kernel32.QueryFullProcessImageNameW(hprc, 0, buff, pointer(size)):
-        kernel32.CloseHandle(hprc)
-        raise WinError(get_last_error())
-    kernel32.CloseHandle(hprc)
-    return str(buff.value)
+    try:
+        return _query_exepath(hprc)
+    finally:
+        CloseHandle(hprc)
 
 
-def get_all_processes(total: int = 1024) -> List[DWORD]:
-    """Retrieves the process identifiers of all running processes.
+def get_exepath_and_elevation(pid: int) -> Tuple[str, bool]:
+    """Retrieves the executable path and the elevation of the specified process with
+    a single process handle, same results as `get_exepath` and `is_elevated`.
+    Results are cached per process, a reused pid is told apart by its creation time
 
-    :param in total: the number of processes to retrieve
+    :param int pid: process id
+    :return: the full path of the executable and whether the process is elevated
+    :rtype: Tuple[str, bool]
+    """
+    if not pid:
+        return "", True
+    try:
+        hprc = open_process_for_limited_query(pid)
+    except OSError:
+        return "", True
+    try:
+        created = _query_creation_time(hprc)
+        cached = _process_info.get(pid)
+        if created and cached and cached[0] == created:
+            return cached[1]
+        info = _query_exepath(hprc), _query_elevation(hprc)
+        if created:
+            if len(_process_info) >= _PROCESS_INFO_CACHE_SIZE:
+                _process_info.clear()
+            _process_info[pid] = created, info
+        return info
+    finally:
+        CloseHandle(hprc)
 
+
+def get_all_processes(total: int = 1024) -> List[int]:
+    """Retrieves the process identifiers of all running processes.
+
+    :param in total: the initial capacity of the buffer, it grows automatically when
+        there are more processes than that
     :return: list of process identifiers
-    :rtype: List[DWORD]
+    :rtype: List[int]
     """
-    buff = (DWORD * total)()
-    size = DWORD(sizeof(buff))
-    if not psapi.EnumProcesses(byref(buff), size, pointer(size)):
+    global _proc_buff  # pylint: disable=global-statement
+    with _proc_buff_lock:
+        if len(_proc_buff) < total:
+            _proc_buff = (DWORD * total)()
+        size = DWORD()
+        while True:
+            if not EnumProcesses(_proc_buff, sizeof(_proc_buff), byref(size)):
+                raise WinError(get_last_error())
+            # a full buffer means the list might be truncated
+            if size.value < sizeof(_proc_buff):
+                break
+            _proc_buff = (DWORD * (len(_proc_buff) * 2))()
+        return _proc_buff[: size.value // sizeof(DWORD)]
+
+
+def _iter_process_basenames() -> Iterator[Tuple[int, str]]:
+    """Iterates over all running processes with a single toolhelp snapshot
+
+    Ref: https://learn.microsoft.com/en-us/windows/win32/api/tlhelp32/nf-tlhelp32-createtoolhelp32snapshot
+
+    :return: pairs of process id and executable name (without directory)
+    :rtype: Iterator[Tuple[int, str]]
+    """
+    hsnap = CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if hsnap == INVALID_HANDLE_VALUE:
         raise WinError(get_last_error())
-    return list(buff[: size.value // sizeof(DWORD)])
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = sizeof(entry)
+        # the loop runs once per process, keep it free of lookups and allocations
+        pentry = byref(entry)
+        process32_next = Process32NextW
+        ok = Process32FirstW(hsnap, pentry)
+        while ok:
+            yield entry.th32ProcessID, entry.szExeFile
+            ok = process32_next(hsnap, pentry)
+    finally:
+        CloseHandle(hsnap)
+
+
+def is_any_exe_running(exes: Iterable[str], nameonly: bool = True) -> Set[str]:
+    """Check which of the specified executables are running with a single pass over
+    the processes
+
+    :param Iterable[str] exes: executable names or full paths
+    :param bool nameonly: if `True`, only check the executable name, otherwise check the full path
+    :return: the executables (as passed in) that are running
+    :rtype: Set[str]
+    """
+    # lowered executable name -> [(lowered full path, original)]
+    pending: Dict[str, List[Tuple[str, str]]] = {}
+    for exe in exes:
+        lowered = exe.lower()
+        pending.setdefault(os.path.basename(lowered), []).append((lowered, exe))
+    running = set()
+    for pid, pname in _iter_process_basenames():
+        if not pending:
+            break
+        pname = pname.lower()
+        candidates = pending.get(pname)
+        if not candidates:
+            continue
+        if nameonly:
+            running.update(exe for _, exe in candidates)
+            del pending[pname]
+            continue
+        # the snapshot carries the executable name already, only open the process
+        # to read the full path when the name matches
+        try:
+            ppath = get_exepath(pid).lower()
+        except: # pylint: disable=bare-except
+            continue
+        remaining = []
+        for lowered, exe in candidates:
+            if lowered == ppath:
+                running.add(exe)
+            else:
+                remaining.append((lowered, exe))
+        if remaining:
+            pending[pname] = remaining
+        else:
+            del pending[pname]
+    return running
 
 
 def is_exe_running(exe: str, nameonly: bool = False) -> bool:
@@ -105,19 +322,7 @@ def is_exe_running(exe: str, nameonly: bool = False) -> bool:
     :return: `True` if running, `False` otherwise
     :rtype: bool
     """
-    exe = exe.lower()
-    if nameonly:
-        exe = os.path.basename(exe)
-    for pid in get_all_processes():
-        try:
-            ppath = get_exepath(pid).lower()
-            if nameonly:
-                ppath = os.path.basename(ppath)
-            if exe == ppath:
-                return True
-        except: # pylint: disable=bare-except
-            pass
-    return False
+    return bool(is_any_exe_running((exe,), nameonly))
 
 
 def get_session_id():
@@ -126,9 +331,8 @@ def get_session_id():
     :return: session id
     :rtype: int
     """
-    session_id = DWORD()
-    kernel32.ProcessIdToSessionId(kernel32.GetCurrentProcessId(), byref(session_id))
-    return kernel32.WTSGetActiveConsoleSessionId()
+    ProcessIdToSessionId(GetCurrentProcessId(), byref(_session_id))
+    return WTSGetActiveConsoleSessionId()
 
 class ProcessDpiAwareness(IntEnum):
     """Process DPI Awareness Level"""
@@ -141,12 +345,17 @@ def get_process_dpi_awareness(pid: int) -> ProcessDpiAwareness:
     """Retrieves the DPI awareness of the process"""
     try:
         hprc = open_process_for_limited_query(pid)
+    except OSError:
+        return ProcessDpiAwareness.UNKNOWN
+    try:
         awareness = c_int()
-        if shcore.GetProcessDpiAwareness(hprc, pointer(awareness)):
+        if _load_shcore().GetProcessDpiAwareness(hprc, byref(awareness)):
             raise WinError(get_last_error())
         return ProcessDpiAwareness(awareness.value)
     except: # pylint: disable=bare-except
         return ProcessDpiAwareness.UNKNOWN
+    finally:
+        CloseHandle(hprc)
 
 if __name__ == "__main__":
     # import sys
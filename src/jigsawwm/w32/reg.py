@@ -1,4 +1,27 @@
 import winreg
+from ctypes import WinDLL
+from ctypes.wintypes import BOOL, DWORD, HANDLE, HKEY, LONG, LPCWSTR, LPVOID
+from threading import Lock
+
+kernel32 = WinDLL("kernel32", use_last_error=True)
+advapi32 = WinDLL("advapi32", use_last_error=True)
+
+REG_NOTIFY_CHANGE_LAST_SET = 0x00000004
+REG_NOTIFY_THREAD_AGNOSTIC = 0x10000000
+WAIT_OBJECT_0 = 0
+
+CreateEventW = kernel32.CreateEventW
+CreateEventW.argtypes = (LPVOID, BOOL, BOOL, LPCWSTR)
+CreateEventW.restype = HANDLE
+SetEvent = kernel32.SetEvent
+SetEvent.argtypes = (HANDLE,)
+SetEvent.restype = BOOL
+WaitForSingleObject = kernel32.WaitForSingleObject
+WaitForSingleObject.argtypes = (HANDLE, DWORD)
+WaitForSingleObject.restype = DWORD
+RegNotifyChangeKeyValue = advapi32.RegNotifyChangeKeyValue
+RegNotifyChangeKeyValue.argtypes = (HKEY, BOOL, DWORD, HANDLE, BOOL)
+RegNotifyChangeKeyValue.restype = LONG
 
 
 def read_reg_key(key, subkey, value):
@@ -12,15 +35,68 @@ def read_reg_key(key, subkey, value):
         return None
 
 
+class RegValueWatcher:
+    """
+    Caches a registry value and reads it again only after the key has been changed
+    """
+
+    def __init__(self, key, subkey, value):
+        self.key = key
+        self.subkey = subkey
+        self.value = value
+        self._lock = Lock()
+        self._handle = None
+        self._cached = None
+        # auto-reset event, initially signaled so the first call reads the value
+        self._changed = CreateEventW(None, False, True, None)
+
+    def get(self):
+        """
+        Returns the cached value, re-reads it if the key has been changed since
+        """
+        with self._lock:
+            if WaitForSingleObject(self._changed, 0) == WAIT_OBJECT_0:
+                self._cached = self._read()
+            return self._cached
+
+    def _read(self):
+        try:
+            if self._handle is None:
+                self._handle = winreg.OpenKey(self.key, self.subkey)
+            # watch before reading so a change in between won't be missed
+            if RegNotifyChangeKeyValue(
+                self._handle.handle,
+                False,
+                REG_NOTIFY_CHANGE_LAST_SET | REG_NOTIFY_THREAD_AGNOSTIC,
+                self._changed,
+                True,
+            ):
+                # unable to watch the key, read it every time
+                SetEvent(self._changed)
+            return winreg.QueryValueEx(self._handle, self.value)[0].hex()
+        except OSError:
+            # the key or value doesn't exist (yet), try again next time
+            if self._handle is not None:
+                self._handle.Close()
+                self._handle = None
+            SetEvent(self._changed)
+            return None
+
+
+VIRTUAL_DESKTOPS_SUBKEY = (
+    r"Software\Microsoft\Windows\CurrentVersion\Explorer\VirtualDesktops"
+)
+
+_current_desktop_id = RegValueWatcher(
+    winreg.HKEY_CURRENT_USER, VIRTUAL_DESKTOPS_SUBKEY, "CurrentVirtualDesktop"
+)
+
+
 def get_current_desktop_id():
     """
     Returns the GUID of the current virtual desktop
     """
-    return read_reg_key(
-        winreg.HKEY_CURRENT_USER,
-        r"Software\Microsoft\Windows\CurrentVersion\Explorer\VirtualDesktops",
-        "CurrentVirtualDesktop",
-    )
+    return _current_desktop_id.get()
 
 
 if __name__ == "__main__":
@@ -1,9 +1,13 @@
+import array
 import enum
 import os
 import random
+import threading
 import time
 import typing
 import logging
+from functools import reduce
+from operator import or_
 from ctypes import *
 from ctypes.wintypes import *
 
@@ -13,6 +17,14 @@ logger = logging.getLogger(__name__)
 user32 = WinDLL("user32", use_last_error=True)
 
 ULONG_PTR = LPARAM
+MAPVK_VK_TO_VSC = 0
+
+MapVirtualKeyW = user32.MapVirtualKeyW
+MapVirtualKeyW.argtypes = (UINT, UINT)
+MapVirtualKeyW.restype = UINT
+GetKeyboardLayout = user32.GetKeyboardLayout
+GetKeyboardLayout.argtypes = (DWORD,)
+GetKeyboardLayout.restype = HKL
 
 
 class INPUTTYPE(enum.IntEnum):
@@ -90,29 +102,54 @@ class INPUT(Structure):
     )
 
 
-random.seed(os.getpid())
+SendInput = user32.SendInput
+SendInput.argtypes = (UINT, POINTER(INPUT), c_int)
+SendInput.restype = UINT
+
+# a private generator so importing this module won't reseed the global one
+_rng = random.Random(os.getpid())
 
 
 def random_flags(length: int = 4, a: int = 0, b: int = 31) -> int:
-    flags = set()
-    while len(flags) < length:
-        flags.add(1 << random.randint(a, b))
-    return flags
+    return {1 << i for i in _rng.sample(range(a, b + 1), length)}
 
 
 def combine_flags(flags: typing.Iterable[int]) -> int:
-    flag = 0
-    for f in flags:
-        flag |= f
-    return flag
+    return reduce(or_, flags, 0)
 
 
 FLAGS = random_flags()
 SYNTHESIZED_FLAG = combine_flags(FLAGS)
 
 
+_INPUT_SIZE = sizeof(INPUT)
+_KEYBOARD = int(INPUTTYPE.KEYBOARD)
+_MOUSE = int(INPUTTYPE.MOUSE)
+_UNICODE = int(KEYEVENTF.UNICODE)
+_input_buff = (INPUT * 64)()
+_input_buff_lock = threading.Lock()
+_scan_codes: typing.Dict[int, int] = {}
+_scan_codes_layout = None
+
+
+def _refresh_scan_codes():
+    """Forget the cached scan codes if the keyboard layout has been switched"""
+    global _scan_codes_layout  # pylint: disable=global-statement
+    layout = GetKeyboardLayout(0)
+    if layout != _scan_codes_layout:
+        _scan_codes.clear()
+        _scan_codes_layout = layout
+
+
+def _scan_code_of(vk: int) -> int:
+    """Translates the virtual key to its scan code, the result is cached per layout"""
+    scan_code = _scan_codes.get(vk)
+    if scan_code is None:
+        scan_code = _scan_codes[vk] = MapVirtualKeyW(vk, MAPVK_VK_TO_VSC)
+    return scan_code
+
+
 def send_input(*inputs: typing.List[INPUT], extra: int = 0):
-    global SYNTHESIZED_FLAG
     """Synthesizes keystrokes, mouse motions, and button clicks.
 
     Usage:
@@ -133,31 +170,68 @@ def send_input(*inputs: typing.List[INPUT], extra: int = 0):
         to be sent to system
 
     """
-    for item in inputs:
+    global _input_buff  # pylint: disable=global-statement
+    extra_info = extra | SYNTHESIZED_FLAG
+    if len(inputs) == 1:
+        # most callers send a single input, stamp a copy of it in the first slot of
+        # the reusable array like the batch does, without walking the batch loop
+        item = inputs[0]
         if item is None:
-            continue
-        if item.type == INPUTTYPE.KEYBOARD:
-            item.ki.dwExtraInfo = ULONG_PTR(extra | SYNTHESIZED_FLAG)
-            if not item.ki.wScan and not item.ki.dwFlags & KEYEVENTF.UNICODE:
-                item.ki.wScan = user32.MapVirtualKeyW(item.ki.wVk, 0)
-            # item.ki.dwFlags |= KEYEVENTF.SCANCODE
-            # print("virt key", item.ki.wVk, "scan code", item.ki.wScan)
-        elif item.type == INPUTTYPE.MOUSE:
-            item.mi.dwExtraInfo = ULONG_PTR(extra | SYNTHESIZED_FLAG)
-    length = len(inputs)
-    array = INPUT * length
-    if not user32.SendInput(length, array(*inputs), sizeof(INPUT)):
-        logger.exception("send input error: %s", WinError(get_last_error())) 
+            return
+        with _input_buff_lock:
+            buff = _input_buff
+            buff[0] = item
+            dst = buff[0]
+            input_type = dst.type
+            if input_type == _KEYBOARD:
+                ki = dst.ki
+                ki.dwExtraInfo = extra_info
+                if not ki.wScan and not ki.dwFlags & _UNICODE:
+                    _refresh_scan_codes()
+                    ki.wScan = _scan_code_of(ki.wVk)
+            elif input_type == _MOUSE:
+                dst.mi.dwExtraInfo = extra_info
+            _submit_input(buff, 1)
+        return
+    with _input_buff_lock:
+        # copy the inputs into a reusable array and submit them with a single call
+        buff = _input_buff
+        if len(inputs) > len(buff):
+            buff = _input_buff = (INPUT * len(inputs))()
+        _refresh_scan_codes()
+        length = 0
+        for item in inputs:
+            if item is None:
+                continue
+            # assigning a structure to an array slot is a plain memcpy in C
+            buff[length] = item
+            dst = buff[length]
+            length += 1
+            input_type = dst.type
+            if input_type == _KEYBOARD:
+                # every access to a nested structure builds a new view, bind it once
+                ki = dst.ki
+                ki.dwExtraInfo = extra_info
+                if not ki.wScan and not ki.dwFlags & _UNICODE:
+                    ki.wScan = _scan_code_of(ki.wVk)
+                # ki.dwFlags |= KEYEVENTF.SCANCODE
+                # print("virt key", ki.wVk, "scan code", ki.wScan)
+            elif input_type == _MOUSE:
+                dst.mi.dwExtraInfo = extra_info
+        _submit_input(buff, length)
+
+
+def _submit_input(buff: typing.Sequence[INPUT], length: int):
+    """Submits the first `length` prepared inputs of the array with a single call"""
+    if length and not SendInput(length, buff, _INPUT_SIZE):
+        logger.exception("send input error: %s", WinError(get_last_error()))
 
 
 def is_synthesized(msg: typing.Union[KEYBDINPUT, MOUSEINPUT]) -> bool:
     """Check if keyboard/mouse event is sent by this module"""
     # the propability of conflict is 31 x 30 x 29 x 28 ...
-    global FLAGS
-    for flag in FLAGS:
-        if not msg.dwExtraInfo & flag:
-            return False
-    return True
+    flag = SYNTHESIZED_FLAG
+    return msg.dwExtraInfo & flag == flag
 
 
 def set_synthesized_flag(flag: int):
@@ -165,52 +239,42 @@ def set_synthesized_flag(flag: int):
     SYNTHESIZED_FLAG = flag
 
 
+# (dwFlags, mouseData) of the mouse "keys" when pressed / released
+_MOUSE_PRESSED = {
+    Vk.LBUTTON: (MOUSEEVENTF.LEFTDOWN, 0),
+    Vk.RBUTTON: (MOUSEEVENTF.RIGHTDOWN, 0),
+    Vk.MBUTTON: (MOUSEEVENTF.MIDDLEDOWN, 0),
+    Vk.XBUTTON1: (MOUSEEVENTF.XDOWN, 0x0001),
+    Vk.XBUTTON2: (MOUSEEVENTF.XDOWN, 0x0002),
+    Vk.WHEEL_UP: (MOUSEEVENTF.WHEEL, 120),
+    Vk.WHEEL_DOWN: (MOUSEEVENTF.WHEEL, -120),
+}
+_MOUSE_RELEASED = {
+    Vk.LBUTTON: (MOUSEEVENTF.LEFTUP, 0),
+    Vk.RBUTTON: (MOUSEEVENTF.RIGHTUP, 0),
+    Vk.MBUTTON: (MOUSEEVENTF.MIDDLEUP, 0),
+    Vk.XBUTTON1: (MOUSEEVENTF.XUP, 0x0001),
+    Vk.XBUTTON2: (MOUSEEVENTF.XUP, 0x0002),
+    Vk.WHEEL_UP: (MOUSEEVENTF.WHEEL, 120),
+    Vk.WHEEL_DOWN: (MOUSEEVENTF.WHEEL, -120),
+}
+_NO_MOUSE_EVENT = (0, 0)
+_MS_BOUND = int(Vk.MS_BOUND)
+_KB_BOUND = int(Vk.KB_BOUND)
+_EXTENDED_KEYS = frozenset(range(Vk.PRIOR, Vk.HELP + 1))
+
+
 def vk_to_input(vk: Vk, pressed: bool = None, flags: int = 0) -> typing.Optional[INPUT]:
-    if vk < Vk.MS_BOUND or vk > Vk.KB_BOUND:
-        dwFlags = 0
-        mouseData = 0
-        if vk == Vk.LBUTTON:
-            if pressed:
-                dwFlags = MOUSEEVENTF.LEFTDOWN
-            else:
-                dwFlags = MOUSEEVENTF.LEFTUP
-        elif vk == Vk.RBUTTON:
-            if pressed:
-                dwFlags = MOUSEEVENTF.RIGHTDOWN
-            else:
-                dwFlags = MOUSEEVENTF.RIGHTUP
-        elif vk == Vk.MBUTTON:
-            if pressed:
-                dwFlags = MOUSEEVENTF.MIDDLEDOWN
-            else:
-                dwFlags = MOUSEEVENTF.MIDDLEUP
-        elif vk == Vk.XBUTTON1:
-            mouseData = 0x0001
-            if pressed:
-                dwFlags = MOUSEEVENTF.XDOWN
-            else:
-                dwFlags = MOUSEEVENTF.XUP
-        elif vk == Vk.XBUTTON2:
-            mouseData = 0x0002
-            if pressed:
-                dwFlags = MOUSEEVENTF.XDOWN
-            else:
-                dwFlags = MOUSEEVENTF.XUP
-        elif vk == Vk.WHEEL_UP:
-            mouseData = 120
-            dwFlags = MOUSEEVENTF.WHEEL
-        elif vk == Vk.WHEEL_DOWN:
-            mouseData = -120
-            dwFlags = MOUSEEVENTF.WHEEL
+    if vk < _MS_BOUND or vk > _KB_BOUND:
+        table = _MOUSE_PRESSED if pressed else _MOUSE_RELEASED
+        dwFlags, mouseData = table.get(vk, _NO_MOUSE_EVENT)
         return INPUT(
             type=INPUTTYPE.MOUSE,
             mi=MOUSEINPUT(dwFlags=dwFlags | flags, mouseData=mouseData),
         )
     else:
-        dwFlags = 0
-        if not pressed:
-            dwFlags |= KEYEVENTF.KEYUP
-        if vk >= vk.PRIOR and vk <= vk.HELP:
+        dwFlags = 0 if pressed else KEYEVENTF.KEYUP
+        if vk in _EXTENDED_KEYS:
             dwFlags |= KEYEVENTF.EXTENDEDKEY
         return INPUT(
             type=INPUTTYPE.KEYBOARD,
@@ -218,47 +282,56 @@ def vk_to_input(vk: Vk, pressed: bool = None, flags: int = 0) -> typing.Optional
         )
 
 
+_MODIFIER_KEYS = (Vk.LSHIFT, Vk.RSHIFT, Vk.LCONTROL, Vk.RCONTROL, Vk.LMENU, Vk.RMENU)
+
+
+_reset_buff = (INPUT * len(_MODIFIER_KEYS))(
+    *(vk_to_input(key, pressed=False) for key in _MODIFIER_KEYS)
+)
+
+
 def reset_modifiers():
-    send_input(
-        vk_to_input(key, pressed=False)
-        for key in [Vk.LSHIFT, Vk.RSHIFT, Vk.LCONTROL, Vk.RCONTROL, Vk.LMENU, Vk.RMENU]
-    )
+    # the key-up inputs are constant, only the flag and scan codes need stamping
+    with _input_buff_lock:
+        _refresh_scan_codes()
+        extra_info = SYNTHESIZED_FLAG
+        for item in _reset_buff:
+            item.ki.dwExtraInfo = extra_info
+            item.ki.wScan = _scan_code_of(item.ki.wVk)
+        _submit_input(_reset_buff, len(_reset_buff))
 
 
 def send_combination(*comb: typing.Sequence[Vk]):
     # reset_modifiers()
-    # press keys in combination in order
-    for key in comb:
-        send_input(vk_to_input(key, pressed=True))
-    # release keys in combination in reverse order
-    for key in reversed(comb):
-        send_input(vk_to_input(key, pressed=False))
+    # press keys in combination in order, then release them in reverse order,
+    # all staged up front and sent in one batch
+    inputs = [vk_to_input(key, pressed=True) for key in comb]
+    inputs += [vk_to_input(key, pressed=False) for key in reversed(comb)]
+    send_input(*inputs)
 
 
 def send_text(text: str):
     """Send unicode text including emojis to active window. NOTE: do NOT use this in side
     a Hotkey with ALT modifier, it won't work and I don't know how to mitigate(sending ALT up didn't work).
     """
-    b = text.encode("utf_16_le")
-    for i in range(0, len(b), 2):
-        code = b[i] | b[i + 1] << 8
-        send_input(
-            INPUT(
-                type=INPUTTYPE.KEYBOARD,
-                ki=KEYBDINPUT(dwFlags=KEYEVENTF.UNICODE, wScan=code),
-            ),
-            INPUT(
-                type=INPUTTYPE.KEYBOARD,
-                ki=KEYBDINPUT(dwFlags=KEYEVENTF.UNICODE | KEYEVENTF.KEYUP, wScan=code),
-            ),
-        )
+    # surrogate pairs are already adjacent code units in UTF-16, send them in order
+    codes = array.array("H")
+    codes.frombytes(text.encode("utf_16_le"))
+    buff = (INPUT * (len(codes) * 2))()
+    extra_info = SYNTHESIZED_FLAG
+    down_flags = KEYEVENTF.UNICODE
+    up_flags = KEYEVENTF.UNICODE | KEYEVENTF.KEYUP
+    for i, code in enumerate(codes):
+        down, up = buff[i * 2], buff[i * 2 + 1]
+        down.type = up.type = INPUTTYPE.KEYBOARD
+        down.ki.wScan = up.ki.wScan = code
+        down.ki.dwFlags = down_flags
+        up.ki.dwFlags = up_flags
+        down.ki.dwExtraInfo = up.ki.dwExtraInfo = extra_info
+    _submit_input(buff, len(buff))
 
 
 if __name__ == "__main__":
-    import time
-
-    from .vk import Vk
-
     # print(hex(ord("😂")))
     # encodings = [
     #     "utf_32",
@@ -1,6 +1,6 @@
 """Hook and inspect keyboard and mouse events"""
-# pylint: disable=consider-using-f-string
 import logging
+import queue
 import time
 import threading
 from ctypes import * # pylint: disable=wildcard-import,unused-wildcard-import
@@ -13,13 +13,50 @@ from .hook import * # pylint: disable=wildcard-import,unused-wildcard-import
 
 logging.basicConfig(level=logging.DEBUG)
 
+_events = queue.SimpleQueue()
+_VK_NAMES = {vk.value: vk.name for vk in Vk}
+
+
+def _drain_events():
+    """Formats and prints the events off the hook thread"""
+    while True:
+        kind, *args = _events.get()
+        if kind == "kb":
+            vk_code, msgid_name, scan_code, flags, ts, extra = args
+            print(
+                f"{_VK_NAMES.get(vk_code, Vk.UNKNOWN.name):15s} {msgid_name:15s}: vkCode {vk_code:3x} "
+                f"scanCode {scan_code:3x} flags: {flags:3d}, time: {ts} extra: {extra}"
+            )
+        elif kind == "ms":
+            msgid_name, x, y, hi, lo, flags, extra, ts, delta = args
+            print(
+                f"{msgid_name:15s}  x: {x:3d} y: {y:3d} hi: {hi:5x} lo: {lo:5x} "
+                f"flags: {flags:3x} extra: {extra:6x} t: {ts:d}"
+            )
+            if delta is not None:
+                print(f"delta: {delta}")
+        else:
+            now, event_name, hwnd, id_obj, id_chd = args
+            print("==================================")
+            print(
+                f"[{now:%M:%S.%f}] {event_name:30s} {hwnd:8d} "
+                f"ido: {id_obj:6d} idc: {id_chd:6d} {window.Window(hwnd).title}"
+            )
+            window.inspect_window(hwnd)
+            print("==================================")
+
+
+threading.Thread(target=_drain_events, daemon=True).start()
+
+
 def keyboard_cb(_code: int, msgid: KBDLLHOOKMSGID, msg: KBDLLHOOKDATA) -> bool:
     """Keyboard hook callback"""
-    print(
-        "{:15s} {:15s}: vkCode {:3x} scanCode {:3x} flags: {:3d}, time: {} extra: {}".format(
-            Vk(msg.vkCode).name,
-            msgid.name,
+    # msg is owned by Windows, copy the fields out before returning
+    _events.put_nowait(
+        (
+            "kb",
             msg.vkCode,
+            msgid.name,
             msg.scanCode,
             msg.flags,
             msg.time,
@@ -29,8 +66,9 @@ def keyboard_cb(_code: int, msgid: KBDLLHOOKMSGID, msg: KBDLLHOOKDATA) -> bool:
 
 def mouse_cb(_code: int, msgid: MSLLHOOKMSGID, msg: MSLLHOOKDATA) -> bool:
     """Mouse hook callback"""
-    print(
-        "{:15s}  x: {:3d} y: {:3d} hi: {:5x} lo: {:5x} flags: {:3x} extra: {:6x} t: {:d}".format(
+    _events.put_nowait(
+        (
+            "ms",
             msgid.name,
             msg.pt.x,
             msg.pt.y,
@@ -39,10 +77,9 @@ def mouse_cb(_code: int, msgid: MSLLHOOKMSGID, msg: MSLLHOOKDATA) -> bool:
             msg.flags,
             msg.dwExtraInfo,
             msg.time,
+            msg.get_wheel_delta() if msgid == MSLLHOOKMSGID.WM_MOUSEWHEEL else None,
         )
     )
-    if msgid == MSLLHOOKMSGID.WM_MOUSEWHEEL:
-        print("delta: {}".format(msg.get_wheel_delta()))
 
 def winevent_cb(
     event: WinEvent,
@@ -60,19 +97,7 @@ def winevent_cb(
         WinEvent.EVENT_SYSTEM_CAPTUREEND,
     ):
         return
-    print("==================================")
-    print(
-        "[{now}] {event:30s} {hwnd:8d} ido: {id_obj:6d} idc: {id_chd:6d} {title}".format(
-            now=datetime.now().strftime("%M:%S.%f"),
-            event=event.name,
-            hwnd=hwnd or 0,
-            id_obj=id_obj,
-            id_chd=id_chd,
-            title=window.Window(hwnd).title,
-        )
-    )
-    window.inspect_window(hwnd)
-    print("==================================")
+    _events.put_nowait(("we", datetime.now(), event.name, hwnd or 0, id_obj, id_chd))
 
 kb_hook = hook_keyboard(keyboard_cb)
 ms_hook = hook_mouse(mouse_cb)
@@ -1,6 +1,8 @@
+import winreg
 from pyvda import AppView, VirtualDesktop
+from .reg import VIRTUAL_DESKTOPS_SUBKEY, RegValueWatcher, get_current_desktop_id
 from .window import Window
-from typing import  Optional
+from typing import  Dict, Optional
 
 # number_of_active_desktops = len(get_virtual_desktops())
 # print(f"There are {number_of_active_desktops} active desktops")
@@ -20,21 +22,62 @@ from typing import  Optional
 # AppView.current().pin()
 
 
+_desktop_ids = RegValueWatcher(
+    winreg.HKEY_CURRENT_USER, VIRTUAL_DESKTOPS_SUBKEY, "VirtualDesktopIDs"
+)
+_desktops_of_ids = None
+_desktops: Dict[int, VirtualDesktop] = {}
+_desktop_numbers: Dict[str, int] = {}
+
+
+def _sync_desktops() -> bool:
+    """Drop the cached desktops if they have been added / removed / reordered,
+    returns False if the changes can not be tracked"""
+    global _desktops_of_ids  # pylint: disable=global-statement
+    ids = _desktop_ids.get()
+    if ids != _desktops_of_ids:
+        _desktops.clear()
+        _desktop_numbers.clear()
+        _desktops_of_ids = ids
+    return ids is not None
+
+
+def get_desktop(desktop_number: int) -> VirtualDesktop:
+    """Returns the VirtualDesktop of the number, cached until the desktops change"""
+    if not _sync_desktops():
+        return VirtualDesktop(desktop_number)
+    desktop = _desktops.get(desktop_number)
+    if desktop is None:
+        desktop = _desktops[desktop_number] = VirtualDesktop(desktop_number)
+    return desktop
+
+
+def get_current_desktop_number() -> int:
+    """Returns the number of the current desktop, cached until the desktops change"""
+    desktop_id = get_current_desktop_id()
+    if desktop_id is None or not _sync_desktops():
+        return VirtualDesktop.current().number
+    number = _desktop_numbers.get(desktop_id)
+    if number is None:
+        number = _desktop_numbers[desktop_id] = VirtualDesktop.current().number
+    return number
+
+
 def switch_desktop(desktop_number):
-    target_desktop = VirtualDesktop(desktop_number)
-    target_desktop.go()
+    get_desktop(desktop_number).go()
 
 def switch_desktop_delta(delta: int):
-    switch_desktop(desktop_delta_to_number(delta))
+    get_desktop(desktop_delta_to_number(delta)).go()
 
-def move_to_desktop(desktop_number, window: Optional[Window]  = None):
+def _move_to(target_desktop: VirtualDesktop, window: Optional[Window] = None):
     appview = AppView(window.handle) if window else AppView.current()
-    target_desktop = VirtualDesktop(desktop_number)
     appview.move(target_desktop)
 
+def move_to_desktop(desktop_number, window: Optional[Window]  = None):
+    _move_to(get_desktop(desktop_number), window)
+
 def move_to_desktop_delta(delta: int, window: Optional[Window]  = None):
-    move_to_desktop(desktop_delta_to_number(delta), window)
+    _move_to(get_desktop(desktop_delta_to_number(delta)), window)
 
 def desktop_delta_to_number(delta: int):
-    current_desktop = VirtualDesktop.current()
-    return current_desktop.number + delta
\ No newline at end of file
+    return get_current_desktop_number() + delta
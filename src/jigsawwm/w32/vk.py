@@ -1,9 +1,63 @@
-import enum
+import itertools
+import types
 import typing
-from ctypes import WinDLL, wintypes
+from ctypes import POINTER, WinDLL, WinError, c_ubyte, get_last_error, wintypes
 
 
-class Vk(enum.IntEnum):
+class _FastIntEnumMeta(type):
+    """A lean take on `enum.EnumMeta` for int only enumerations: members are int
+    instances carrying `name` / `value` as plain attributes and looking them up,
+    either by attribute or by calling the class, is a single dict hit.
+    Duplicated values become aliases of the first member, like `enum` does.
+    """
+
+    def __new__(mcs, cls_name, bases, namespace):
+        fields = {
+            name: value
+            for name, value in namespace.items()
+            if not name.startswith("_") and type(value) is int
+        }
+        for name in fields:
+            del namespace[name]
+        cls = super().__new__(mcs, cls_name, bases, namespace)
+        members = {}
+        value2member = {}
+        member_names = []
+        for name, value in fields.items():
+            member = value2member.get(value)
+            if member is None:
+                member = int.__new__(cls, value)
+                member.name = name
+                member.value = value
+                value2member[value] = member
+                member_names.append(name)
+            members[name] = member
+            type.__setattr__(cls, name, member)
+        cls.__members__ = types.MappingProxyType(members)
+        cls._value2member_map_ = value2member
+        cls._member_names_ = member_names
+        return cls
+
+    def __call__(cls, value):
+        try:
+            return cls._value2member_map_[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+    def __getitem__(cls, name):
+        return cls.__members__[name]
+
+    def __iter__(cls):
+        return (cls.__members__[name] for name in cls._member_names_)
+
+    def __len__(cls):
+        return len(cls._member_names_)
+
+    def __contains__(cls, member):
+        return isinstance(member, cls)
+
+
+class Vk(int, metaclass=_FastIntEnumMeta):
     """Win32 virtual key code
 
     Ref: https://learn.microsoft.com/en-us/windows/win32/inputdev/virtual-key-codes
@@ -219,9 +273,13 @@ class Vk(enum.IntEnum):
     WHEEL_UP = 0x1000
     WHEEL_DOWN = 0x1001
 
-    @classmethod
-    def _missing_(cls, value):
-        return cls.UNKNOWN
+    def __repr__(self):
+        return f"<{self.__class__.__name__}.{self.name}: {self.value}>"
+
+    __str__ = int.__repr__
+
+    def __reduce_ex__(self, _protocol):
+        return self.__class__, (self.value,)
 
     # alias
     LCTRL = LCONTROL
@@ -253,22 +311,23 @@ class Vk(enum.IntEnum):
     PGDN = NEXT
 
 
-VkAliases: typing.Dict[str, Vk] = {
-    "LCTRL": Vk.LCONTROL,
-    "LCTL": Vk.LCONTROL,
-    "LALT": Vk.LMENU,
-    "LSFT": Vk.LSHIFT,
-    "LSUPER": Vk.LWIN,
-    "RCTRL": Vk.RCONTROL,
-    "RCTL": Vk.RCONTROL,
-    "RALT": Vk.RMENU,
-    "RSFT": Vk.RSHIFT,
-    "RSUPER": Vk.RWIN,
-    "CTRL": Vk.CONTROL,
-    "MENU": Vk.MENU,
-    "ALT": Vk.MENU,
-    "SFT": Vk.SHIFT,
-    "SUPER": Vk.WIN,
+# keyboard codes are dense in 0x00-0xFF, index them directly
+_VK_BY_CODE: typing.List[Vk] = [Vk.UNKNOWN] * 256
+for _vk in Vk:
+    if 0 <= _vk < 256:
+        _VK_BY_CODE[_vk] = _vk
+del _vk
+
+
+def vk_from_code(code: int) -> Vk:
+    """Converts the raw virtual key code to Vk, unknown codes map to Vk.UNKNOWN"""
+    if 0 <= code < 256:
+        return _VK_BY_CODE[code]
+    return Vk._value2member_map_.get(code, Vk.UNKNOWN)
+
+
+# punctuations that can't be spelled as attribute names
+_PUNCTUATIONS: typing.Dict[str, Vk] = {
     "-": Vk.OEM_MINUS,
     "=": Vk.OEM_PLUS,
     ";": Vk.OEM_1,
@@ -282,84 +341,146 @@ VkAliases: typing.Dict[str, Vk] = {
     ".": Vk.OEM_PERIOD,
 }
 
-
-Modifers = {
-    Vk.LCONTROL,
-    Vk.RCONTROL,
-    Vk.CONTROL,
-    Vk.LSHIFT,
-    Vk.RSHIFT,
-    Vk.SHIFT,
-    Vk.LMENU,
-    Vk.RMENU,
-    Vk.MENU,
-    Vk.LWIN,
-    Vk.RWIN,
-    Vk.WIN,
-    Vk.XBUTTON1,
-    Vk.XBUTTON2,
+# the aliases declared in the class body plus the punctuations
+VkAliases: typing.Mapping[str, Vk] = types.MappingProxyType(
+    {
+        **{name: vk for name, vk in Vk.__members__.items() if name != vk.name},
+        **_PUNCTUATIONS,
+    }
+)
+
+
+Modifers = frozenset(
+    {
+        Vk.LCONTROL,
+        Vk.RCONTROL,
+        Vk.CONTROL,
+        Vk.LSHIFT,
+        Vk.RSHIFT,
+        Vk.SHIFT,
+        Vk.LMENU,
+        Vk.RMENU,
+        Vk.MENU,
+        Vk.LWIN,
+        Vk.RWIN,
+        Vk.WIN,
+        Vk.XBUTTON1,
+        Vk.XBUTTON2,
+    }
+)
+
+
+# names and aliases to Vk, aliases take precedence
+_KEY_TABLE: typing.Dict[str, Vk] = {
+    name.upper(): vk for name, vk in {**Vk.__members__, **VkAliases}.items()
 }
 
 
+# single ascii characters to Vk, indexed by ord() for either case
+_CHAR_TO_VK: typing.List[typing.Optional[Vk]] = [None] * 128
+for _name, _vk in _KEY_TABLE.items():
+    if len(_name) == 1 and ord(_name) < 128:
+        _CHAR_TO_VK[ord(_name)] = _CHAR_TO_VK[ord(_name.lower())] = _vk
+del _name, _vk
+
+
 def parse_key(key: str) -> Vk:
     """parse key in string to Vk"""
+    if len(key) == 1 and ord(key) < 128:
+        vk = _CHAR_TO_VK[ord(key)]
+        if vk is not None:
+            return vk
     key_name = key.strip().upper()
-    # try alias
-    key = VkAliases.get(key_name)
-    # try name
-    if key is None:
-        if key_name not in Vk.__members__:
-            raise ValueError(f"invalid key: {key_name}")
-        return Vk[key_name]
-    return key
-
-
-def parse_combination(combkeys: str) -> typing.Sequence[Vk]:
-    """Converts combination in plain text ("Ctrl+s") to Sequence[Vk] ([Vk.CONTROL, Vk.S])"""
-    parsed = []
-    if not combkeys:
-        return parsed
-    for key_name in combkeys.split("+"):
-        parsed.append(parse_key(key_name))
+    try:
+        return _KEY_TABLE[key_name]
+    except KeyError:
+        raise ValueError(f"invalid key: {key_name}") from None
+
+
+# parsed combinations are interned, they are registered once and looked up repeatedly
+_combinations: typing.Dict[str, typing.Tuple[Vk, ...]] = {}
+
+
+def parse_combination(combkeys: str) -> typing.Tuple[Vk, ...]:
+    """Converts combination in plain text ("Ctrl+s") to Tuple[Vk] ((Vk.CONTROL, Vk.S)),
+    results are interned and shared, hence immutable"""
+    parsed = _combinations.get(combkeys)
+    if parsed is None:
+        if not combkeys:
+            return ()
+        parsed = tuple(parse_key(key_name) for key_name in combkeys.split("+"))
+        # setdefault so concurrent parsing of the same text ends up with one tuple
+        parsed = _combinations.setdefault(combkeys, parsed)
     return parsed
 
 
-_key_expansions = {
-    Vk.CONTROL: [Vk.LCONTROL, Vk.RCONTROL],
-    Vk.MENU: [Vk.LMENU, Vk.RMENU],
-    Vk.SHIFT: [Vk.LSHIFT, Vk.RSHIFT],
-    Vk.WIN: [Vk.LWIN, Vk.RWIN],
-}
+_key_expansions: typing.Mapping[Vk, typing.Tuple[Vk, ...]] = types.MappingProxyType(
+    {
+        Vk.CONTROL: (Vk.LCONTROL, Vk.RCONTROL),
+        Vk.MENU: (Vk.LMENU, Vk.RMENU),
+        Vk.SHIFT: (Vk.LSHIFT, Vk.RSHIFT),
+        Vk.WIN: (Vk.LWIN, Vk.RWIN),
+    }
+)
 
 
 def expand_combination(
     combkeys: typing.Sequence[Vk],
-    index: typing.Optional[int] = 0,
-) -> typing.Iterator[typing.Sequence[Vk]]:
-    """Expand `Ctrl+s` to `LCtrl+s` and `RCtrl+s`, so on and so forth"""
-    key = combkeys[index]
-    expansions = _key_expansions.get(key)
-    if expansions:
-        is_last = index + 1 == len(combkeys)
-        for mk in expansions:
-            new_combkeys = combkeys[:index] + [mk]
-            if is_last:
-                yield new_combkeys
-            else:
-                yield from expand_combination(
-                    new_combkeys + combkeys[index + 1 :], index + 1
-                )
-    else:
-        yield combkeys
-
-
-GetKeyState = WinDLL("user32").GetKeyState
-GetKeyState.restype = wintypes.SHORT
+) -> typing.Iterator[typing.Tuple[Vk, ...]]:
+    """Expand `Ctrl+s` to `LCtrl+s` and `RCtrl+s`, so on and so forth.
+    Only the leading run of modifiers is expanded, keys from the first one without
+    expansions onward are kept as they are"""
+    expansions = []
+    for key in combkeys:
+        keys = _key_expansions.get(key)
+        if not keys:
+            break
+        expansions.append(keys)
+    rest = tuple(combkeys[len(expansions) :])
+    return (prefix + rest for prefix in itertools.product(*expansions))
+
+
+def expanded_combinations(
+    combkeys: typing.Sequence[Vk],
+) -> typing.FrozenSet[typing.Tuple[Vk, ...]]:
+    """Materializes `expand_combination` once, meant to be called on registration
+    so matching the pressed keys later on is a hash lookup"""
+    return frozenset(expand_combination(combkeys))
+
+
+_user32 = None
+
+
+def _load_user32() -> WinDLL:
+    """Loads user32 on first use, so importing Vk alone won't load it"""
+    global _user32  # pylint: disable=global-statement
+    if _user32 is None:
+        dll = WinDLL("user32", use_last_error=True)
+        dll.GetKeyState.argtypes = (wintypes.INT,)
+        dll.GetKeyState.restype = wintypes.SHORT
+        dll.GetKeyboardState.argtypes = (POINTER(c_ubyte),)
+        dll.GetKeyboardState.restype = wintypes.BOOL
+        _user32 = dll
+    return _user32
 
 
 def is_key_down(vk: Vk) -> bool:
     """Retrieve key state from the OS"""
-    return bool(GetKeyState(vk) & 0x8000)
+    # members carry their code as a plain int, hand that to ctypes directly
+    return (_user32 or _load_user32()).GetKeyState(vk.value) & 0x8000 != 0
+
+
+def is_keys_down(vks: typing.Iterable[Vk]) -> typing.Dict[Vk, bool]:
+    """Retrieve states of multiple keys from the OS with a single call, the states
+    are the same ones `is_key_down` reads with GetKeyState"""
+    user32 = _user32 or _load_user32()
+    states = (c_ubyte * 256)()
+    if not user32.GetKeyboardState(states):
+        raise WinError(get_last_error())
+    return {
+        vk: states[vk] & 0x80 != 0 if 0 <= vk < 256 else is_key_down(vk)
+        for vk in vks
+    }
 
 
 if __name__ == "__main__":
@@ -2,13 +2,13 @@
 
 import logging
 import sys
+import threading
 import time
 from ctypes import *  # pylint: disable=wildcard-import,unused-wildcard-import
 from ctypes.wintypes import *  # pylint: disable=wildcard-import,unused-wildcard-import
-from dataclasses import dataclass, field
-from typing import Callable, Optional, Any, Set, Iterable
+from typing import Callable, Optional, Any, Set, Iterable, List, Tuple
 from os import path
-from functools import cached_property, cmp_to_key
+from functools import cmp_to_key, partial
 
 from . import process
 from .sendinput import send_input, INPUT, INPUTTYPE, KEYBDINPUT, KEYEVENTF
@@ -21,6 +21,9 @@ from .window_structs import (
     WindowExStyle,
     ShowWindowCmd,
     DwmWindowAttribute,
+    Unapplicable,
+    Unmanageable,
+    Untilable,
 )
 
 user32 = WinDLL("user32", use_last_error=True)
@@ -28,21 +31,111 @@ kernel32 = WinDLL("kernel32", use_last_error=True)
 dwmapi = WinDLL("dwmapi", use_last_error=True)
 logger = logging.getLogger(__name__)
 
-MANAGEABLE_CLASSNAME_BLACKLIST = {
-    "Shell_TrayWnd",  # taskbar
-    "Shell_SecondaryTrayWnd",
-    "Progman",  # desktop background
-    "WorkerW",
-    "IME",
-    "Default IME",
-    "MSCTFIME UI",
-}
-APPLICABLE_EXE_BLACKLIST = {
-    "msedge.exe",  # stupid copilot
-    "msedgewebview2.exe",  # this shit would display a invisible widow and hide it right away, what the heck
-    # "msrdc.exe",  # WSL
-    # "wslhost.exe",
-}
+GWL_STYLE = -16
+GWL_EXSTYLE = -20
+WNDENUMPROC = WINFUNCTYPE(BOOL, HWND, LPARAM)
+
+GetWindowLongA = user32.GetWindowLongA
+GetWindowLongA.argtypes = (HWND, c_int)
+GetWindowLongA.restype = LONG
+GetWindow = user32.GetWindow
+GetWindow.argtypes = (HWND, UINT)
+GetWindow.restype = HWND
+IsTopLevelWindow = user32.IsTopLevelWindow
+IsTopLevelWindow.argtypes = (HWND,)
+IsTopLevelWindow.restype = BOOL
+GetWindowTextW = user32.GetWindowTextW
+GetWindowTextW.argtypes = (HWND, LPWSTR, c_int)
+GetWindowTextW.restype = c_int
+SetLastErrorEx = user32.SetLastErrorEx
+SetLastErrorEx.argtypes = (DWORD, DWORD)
+SetLastErrorEx.restype = None
+GetClassNameW = user32.GetClassNameW
+GetClassNameW.argtypes = (HWND, LPWSTR, c_int)
+GetClassNameW.restype = c_int
+GetWindowThreadProcessId = user32.GetWindowThreadProcessId
+GetWindowThreadProcessId.argtypes = (HWND, LPDWORD)
+GetWindowThreadProcessId.restype = DWORD
+GetParent = user32.GetParent
+GetParent.argtypes = (HWND,)
+GetParent.restype = HWND
+IsIconic = user32.IsIconic
+IsIconic.argtypes = (HWND,)
+IsIconic.restype = BOOL
+IsWindowVisible = user32.IsWindowVisible
+IsWindowVisible.argtypes = (HWND,)
+IsWindowVisible.restype = BOOL
+IsZoomed = user32.IsZoomed
+IsZoomed.argtypes = (HWND,)
+IsZoomed.restype = BOOL
+IsWindow = user32.IsWindow
+IsWindow.argtypes = (HWND,)
+IsWindow.restype = BOOL
+SendMessageW = user32.SendMessageW
+SendMessageW.argtypes = (HWND, UINT, WPARAM, LPARAM)
+SendMessageW.restype = LPARAM
+GetClassLongPtrW = user32.GetClassLongPtrW
+GetClassLongPtrW.argtypes = (HWND, c_int)
+GetClassLongPtrW.restype = WPARAM
+GetWindowRect = user32.GetWindowRect
+GetWindowRect.argtypes = (HWND, LPRECT)
+GetWindowRect.restype = BOOL
+SetWindowPos = user32.SetWindowPos
+SetWindowPos.argtypes = (HWND, HWND, c_int, c_int, c_int, c_int, UINT)
+SetWindowPos.restype = BOOL
+BeginDeferWindowPos = user32.BeginDeferWindowPos
+BeginDeferWindowPos.argtypes = (c_int,)
+BeginDeferWindowPos.restype = HANDLE
+DeferWindowPos = user32.DeferWindowPos
+DeferWindowPos.argtypes = (HANDLE, HWND, HWND, c_int, c_int, c_int, c_int, UINT)
+DeferWindowPos.restype = HANDLE
+EndDeferWindowPos = user32.EndDeferWindowPos
+EndDeferWindowPos.argtypes = (HANDLE,)
+EndDeferWindowPos.restype = BOOL
+SetCursorPos = user32.SetCursorPos
+SetCursorPos.argtypes = (c_int, c_int)
+SetCursorPos.restype = BOOL
+SetForegroundWindow = user32.SetForegroundWindow
+SetForegroundWindow.argtypes = (HWND,)
+SetForegroundWindow.restype = BOOL
+GetForegroundWindow = user32.GetForegroundWindow
+GetForegroundWindow.argtypes = ()
+GetForegroundWindow.restype = HWND
+AttachThreadInput = user32.AttachThreadInput
+AttachThreadInput.argtypes = (DWORD, DWORD, BOOL)
+AttachThreadInput.restype = BOOL
+ShowWindow = user32.ShowWindow
+ShowWindow.argtypes = (HWND, c_int)
+ShowWindow.restype = BOOL
+EnumWindows = user32.EnumWindows
+EnumWindows.argtypes = (WNDENUMPROC, LPARAM)
+EnumWindows.restype = BOOL
+GetCurrentThreadId = kernel32.GetCurrentThreadId
+GetCurrentThreadId.argtypes = ()
+GetCurrentThreadId.restype = DWORD
+DwmGetWindowAttribute = dwmapi.DwmGetWindowAttribute
+DwmGetWindowAttribute.argtypes = (HWND, DWORD, LPVOID, DWORD)
+DwmGetWindowAttribute.restype = LONG
+
+MANAGEABLE_CLASSNAME_BLACKLIST = frozenset(
+    {
+        "Shell_TrayWnd",  # taskbar
+        "Shell_SecondaryTrayWnd",
+        "Progman",  # desktop background
+        "WorkerW",
+        "IME",
+        "Default IME",
+        "MSCTFIME UI",
+    }
+)
+APPLICABLE_EXE_BLACKLIST = frozenset(
+    {
+        "msedge.exe",  # stupid copilot
+        "msedgewebview2.exe",  # this shit would display a invisible widow and hide it right away, what the heck
+        # "msrdc.exe",  # WSL
+        # "wslhost.exe",
+    }
+)
 SWP_NOACTIVATE = 0x0010
 SET_WINDOW_RECT_FLAG = SWP_NOACTIVATE
 GCL_HICONSM = -34
@@ -51,33 +144,106 @@ ICON_SMALL = 0
 ICON_BIG = 1
 ICON_SMALL2 = 2
 WM_GETICON = 0x7F
-NOT_TILABLE_EXE_NAMES = {"QuickLook.exe"}
+NOT_TILABLE_EXE_NAMES = frozenset({"QuickLook.exe"})
+# exe names are case-insensitive on Windows, compare them lowercased
+_APPLICABLE_EXE_BLACKLIST = frozenset(x.lower() for x in APPLICABLE_EXE_BLACKLIST)
+_NOT_TILABLE_EXE_NAMES = frozenset(x.lower() for x in NOT_TILABLE_EXE_NAMES)
+ACTIVATE_RETRIES = 5
+ACTIVATE_RETRY_INTERVAL = 0.01  # seconds
+
+# plain int masks, testing an IntFlag membership walks through its members
+_SIZEBOX = int(WindowStyle.SIZEBOX)
+_MAXIMIZEBOX = int(WindowStyle.MAXIMIZEBOX)
+_MINIMIZEBOX = int(WindowStyle.MINIMIZEBOX)
+_DISABLED = int(WindowStyle.DISABLED)
+_TRANSPARENT = int(WindowExStyle.TRANSPARENT)
+
+# per-thread scratch buffers for the getters, their content is copied out right away
+_buff_local = threading.local()
+_buff_factories = {
+    "title": partial(create_unicode_buffer, 512),
+    "class_name": partial(create_unicode_buffer, 256),
+    "rect": RECT,
+    "cloaked": INT,
+}
+
+
+def _local_buff(name: str):
+    """Returns the scratch buffer of the name for the current thread"""
+    buff = getattr(_buff_local, name, None)
+    if buff is None:
+        buff = _buff_factories[name]()
+        setattr(_buff_local, name, buff)
+    return buff
+
+
+class _cached_property:  # pylint: disable=invalid-name
+    """Computes the value on first access and stores it in the instance `__dict__`,
+    which shadows the descriptor from then on. Unlike `functools.cached_property` it
+    takes no lock, computing a value twice in a race is harmless for windows"""
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance.__dict__[self.name] = self.func(instance)
+        return value
 
 
-@dataclass
 class Window:
     """Represents a top-level window
 
     :param hwnd: HWND the window handle
     """
 
+    # plain fields live in slots, `__dict__` is kept for the cached properties
+    __slots__ = (
+        "handle",
+        "restricted_rect",
+        "compensated_rect",
+        "restricted_actual_rect",
+        "attrs",
+        "unapplicable_reason",
+        "unmanageable_reason",
+        "untilable_reason",
+        "parent",
+        "manageable_children",
+        "off",
+        "original_rect",
+        "__dict__",
+        "__weakref__",
+    )
+
     handle: HWND
-    restricted_rect: Rect = None
-    compensated_rect: Rect = None
-    restricted_actual_rect: Rect = None
-    attrs: dict = field(default_factory=dict)
-    unapplicable_reason: Optional[str] = None
-    unmanageable_reason: Optional[str] = None
-    untilable_reason: Optional[str] = None
-    parent: Optional["Window"] = None
-    manageable_children: Set["Window"] = None
-    off: bool = False
-    original_rect: Optional[Rect] = None
+    restricted_rect: Optional[Rect]
+    compensated_rect: Optional[Rect]
+    restricted_actual_rect: Optional[Rect]
+    attrs: dict
+    unapplicable_reason: Optional[Unapplicable]
+    unmanageable_reason: Optional[Unmanageable]
+    untilable_reason: Optional[Untilable]
+    parent: Optional["Window"]
+    manageable_children: Set["Window"]
+    off: bool
+    original_rect: Optional[Rect]
 
     def __init__(self, hwnd: HWND):
         self.handle = hwnd
+        self.restricted_rect = None
+        self.compensated_rect = None
+        self.restricted_actual_rect = None
         self.attrs = {}
+        self.unapplicable_reason = None
+        self.unmanageable_reason = None
+        self.untilable_reason = None
+        self.parent = None
         self.manageable_children = set()
+        self.off = False
+        self.original_rect = None
 
     def __eq__(self, other):
         return isinstance(other, Window) and self.handle == other.handle
@@ -100,37 +266,37 @@ class Window:
     # some windows may change their style after created and there will be no event raised
     # so we need to remember the tilable state to avoid undesirable behavior.
     # i.e. Feishu meeting window initialy is not tilable, but it would become tilable after you press the "Meet now" button
-    @cached_property
+    @_cached_property
     def tilable(self) -> bool:
         """Check if window is tilable"""
         self.untilable_reason = self.check_untilable()
         return not self.untilable_reason
 
-    def check_untilable(self):
+    def check_untilable(self) -> Optional[Untilable]:
         """Check if window is tilable"""
-        style = self.get_style()
-        if WindowStyle.SIZEBOX not in style:
-            return "SIZEBOX not in style"
-        if WindowStyle.MAXIMIZEBOX & style == 0:
-            return "MAXIMIZEBOX not in style"
-        if WindowStyle.MINIMIZEBOX & style == 0:
-            return "MINIMIZEBOX not in style"
+        style = self.style
+        if not style & _SIZEBOX:
+            return Untilable.NO_SIZEBOX
+        if not style & _MAXIMIZEBOX:
+            return Untilable.NO_MAXIMIZEBOX
+        if not style & _MINIMIZEBOX:
+            return Untilable.NO_MINIMIZEBOX
         if not self.is_root_window:
-            return "not a root window"
-        if self.exe_name in NOT_TILABLE_EXE_NAMES:
-            return "exe_name blacklisted"
+            return Untilable.NOT_ROOT_WINDOW
+        if self.exe_name_lower in _NOT_TILABLE_EXE_NAMES:
+            return Untilable.EXE_BLACKLISTED
         return None
 
-    @cached_property
+    @_cached_property
     def manageable(self) -> bool:
         """Check if window is manageable"""
         self.unmanageable_reason = self.check_unmanageable()
         return not self.unmanageable_reason
 
-    def check_unmanageable(self) -> str:
+    def check_unmanageable(self) -> Optional[Unmanageable]:
         """Check if window is a app window which could be managed"""
         if not self.applicable:
-            return "not applicable"
+            return Unmanageable.NOT_APPLICABLE
         if self.is_modal_window:
             return None
         # all the following windows should be manageable
@@ -149,58 +315,58 @@ class Window:
         #
         # NOT manage/tilable fusion360 object selector
         # style        : CLIPCHILDREN, CLIPSIBLINGS, POPUP, VISIBLE
-        style = self.get_style()
-        if WindowStyle.SIZEBOX not in style:
-            return "SIZEBOX not in style"
+        if not self.style & _SIZEBOX:
+            return Unmanageable.NO_SIZEBOX
+        if self.exstyle & _TRANSPARENT:
+            return Unmanageable.TRANSPARENT
+        # the DWM query is the most expensive one, leave it to the last
         if self.is_cloaked:
-            return "%s cloaked"
-        if self.class_name in MANAGEABLE_CLASSNAME_BLACKLIST:
-            return "blacklisted"
-        exstyle = self.get_exstyle()
-        if WindowExStyle.TRANSPARENT in exstyle:
-            return "WindowExStyle.TRANSPARENT"
+            return Unmanageable.CLOAKED
         return None
 
-    @cached_property
+    @_cached_property
     def applicable(self):
         """Retrieve if window is rule applicable"""
         self.unapplicable_reason = self.check_unapplicable()
         return not self.unapplicable_reason
 
-    def check_unapplicable(self):
+    def check_unapplicable(self) -> Optional[Unapplicable]:
         """Check if window can be applied with rule"""
+        # cheap checks first, the exe path and elevation need to open the process
         if not self.is_toplevel:
-            return "not a top-level window"
+            return Unapplicable.NOT_TOPLEVEL
+        if self.class_name in MANAGEABLE_CLASSNAME_BLACKLIST:
+            return Unapplicable.CLASSNAME_BLACKLISTED
         if not self.exe:
-            return "no executable path"
-        if self.exe_name in APPLICABLE_EXE_BLACKLIST:
-            return "exe blacklisted"
-        if process.is_elevated(self.pid):
-            return "admin window"
+            return Unapplicable.NO_EXE
+        if self.exe_name_lower in _APPLICABLE_EXE_BLACKLIST:
+            return Unapplicable.EXE_BLACKLISTED
+        if process.get_exepath_and_elevation(self.pid)[1]:
+            return Unapplicable.ELEVATED
         return None
 
-    @cached_property
+    @_cached_property
     def is_modal_window(self) -> bool:
         """Check if window is a modal window"""
         if not self.is_toplevel:
             return False
-        owner_handle = user32.GetWindow(self.handle, 4)
+        owner_handle = GetWindow(self.handle, 4)
         if not owner_handle:
             return False
-        if not user32.IsTopLevelWindow(owner_handle):
+        if not IsTopLevelWindow(owner_handle):
             return False
-        owner_style = WindowStyle(user32.GetWindowLongA(owner_handle, -16))
-        return WindowStyle.DISABLED in owner_style
+        return bool(GetWindowLongA(owner_handle, GWL_STYLE) & _DISABLED)
 
     @property
     def title(self) -> str:
         """Retrieves the text of the specified window's title bar (if it has one)"""
-        title = create_unicode_buffer(255)
-        user32.GetWindowTextW(self.handle, title, 100)
-        user32.SetLastErrorEx(0)
-        return str(title.value)
+        title = _local_buff("title")
+        # the buffer is shared, only the copied characters belong to this window
+        length = GetWindowTextW(self.handle, title, len(title))
+        SetLastErrorEx(0, 0)
+        return title[:length]
 
-    @cached_property
+    @_cached_property
     def class_name(self):
         """Retrieves the name of the class to which the specified window belongs.
 
@@ -209,20 +375,20 @@ class Window:
         :return: class name
         :rtype: str
         """
-        buff = create_unicode_buffer(100)
-        user32.GetClassNameW(self.handle, buff, 100)
-        return str(buff.value)
+        buff = _local_buff("class_name")
+        length = GetClassNameW(self.handle, buff, len(buff))
+        return buff[:length]
 
-    @cached_property
+    @_cached_property
     def exe(self):
         """Retrieves the full path of the executable
 
         :return: full path of the executable
         :rtype: str
         """
-        return process.get_exepath(self.pid)
+        return process.get_exepath_and_elevation(self.pid)[0]
 
-    @cached_property
+    @_cached_property
     def exe_name(self):
         """Retrieves the name of the executable"""
         exe = self.exe
@@ -230,7 +396,13 @@ class Window:
             exe = path.basename(exe)
         return exe
 
-    @cached_property
+    @_cached_property
+    def exe_name_lower(self) -> Optional[str]:
+        """Retrieves the lowercased name of the executable"""
+        exe_name = self.exe_name
+        return exe_name and exe_name.lower()
+
+    @_cached_property
     def pid(self) -> int:
         """Retrieves the process id
 
@@ -238,18 +410,24 @@ class Window:
         :rtype: int
         """
         pid = DWORD()
-        user32.GetWindowThreadProcessId(self.handle, pointer(pid))
+        GetWindowThreadProcessId(self.handle, byref(pid))
         return pid.value
 
-    @cached_property
+    @_cached_property
+    def _toplevel_and_parent(self):
+        """Retrieves the top-level state and the parent handle in one go, every
+        window detected needs both of them"""
+        return bool(IsTopLevelWindow(self.handle)), GetParent(self.handle)
+
+    @_cached_property
     def parent_handle(self) -> HWND:
         """Retrieves the parent window handle"""
-        return user32.GetParent(self.handle)
+        return self._toplevel_and_parent[1]
 
     @property
     def is_iconic(self) -> bool:
         """Check if window is iconic"""
-        return user32.IsIconic(self.handle)
+        return IsIconic(self.handle)
 
     @property
     def is_visible(self) -> bool:
@@ -260,12 +438,12 @@ class Window:
             Otherwise, the return value is `False`.
         :rtype: bool
         """
-        return bool(user32.IsWindowVisible(self.handle))
+        return bool(IsWindowVisible(self.handle))
 
     @property
     def is_zoomed(self) -> bool:
         """Check if window is maximized"""
-        return user32.IsZoomed(self.handle)
+        return IsZoomed(self.handle)
 
     @property
     def is_fullscreen(self) -> bool:
@@ -273,27 +451,20 @@ class Window:
         hmon = monitor_from_window(self.handle)
         if not hmon:  # window is hmonoved outside of monitors
             return False
-        m = Monitor(hmon)
-        mr = m.get_rect()
-        wr = self.get_rect()
-        return (
-            mr.top == wr.top
-            and mr.left == wr.left
-            and mr.right == wr.right
-            and mr.bottom == wr.bottom
-        )
+        # Rect is a dataclass, == compares all four sides in one go
+        return Monitor(hmon).get_rect() == self.get_rect()
 
-    @cached_property
+    @_cached_property
     def is_elevated(self):
         """Check if window is elevated (Administrator)"""
-        return process.is_elevated(self.pid)
+        return process.get_exepath_and_elevation(self.pid)[1]
 
     @property
     def is_restored(self):
         """Check if window is restored"""
         return not self.is_iconic and not self.is_fullscreen and not self.is_zoomed
 
-    @cached_property
+    @_cached_property
     def dpi_awareness(self):
         """Check if window is api aware"""
         return process.get_process_dpi_awareness(self.pid)
@@ -304,32 +475,34 @@ class Window:
 
         Ref: https://learn.microsoft.com/en-us/windows/win32/api/dwmapi/ne-dwmapi-dwmwindowattribute
         """
-        cloaked = INT()
-        windll.dwmapi.DwmGetWindowAttribute(
+        cloaked = _local_buff("cloaked")
+        if DwmGetWindowAttribute(
             self.handle,
             DwmWindowAttribute.DWMWA_CLOAKED,
-            pointer(cloaked),
+            byref(cloaked),
             sizeof(cloaked),
-        )
+        ):
+            # the shared buffer holds the previous result, not an answer
+            return False
         return bool(cloaked.value)
 
-    @cached_property
+    @_cached_property
     def is_toplevel(self) -> bool:
         """Retrieve if the window is top level"""
-        return user32.IsTopLevelWindow(self.handle)
+        return self._toplevel_and_parent[0]
 
-    @cached_property
+    @_cached_property
     def icon_handle(self) -> HANDLE:
         """Retrieves the icon handle of the specified window"""
-        handle = user32.SendMessageW(self.handle, WM_GETICON, ICON_SMALL2, 0)
+        handle = SendMessageW(self.handle, WM_GETICON, ICON_SMALL2, 0)
         if not handle:
-            handle = user32.SendMessageW(self.handle, WM_GETICON, ICON_SMALL, 0)
+            handle = SendMessageW(self.handle, WM_GETICON, ICON_SMALL, 0)
         if not handle:
-            handle = user32.SendMessageW(self.handle, WM_GETICON, ICON_BIG, 0)
+            handle = SendMessageW(self.handle, WM_GETICON, ICON_BIG, 0)
         if not handle:
-            handle = user32.GetClassLongPtrW(self.handle, GCL_HICONSM)
+            handle = GetClassLongPtrW(self.handle, GCL_HICONSM)
         if not handle:
-            handle = user32.GetClassLongPtrW(self.handle, GCL_HICON)
+            handle = GetClassLongPtrW(self.handle, GCL_HICON)
         return handle
 
     def get_attr(self, key: str) -> Any:
@@ -338,13 +511,23 @@ class Window:
             logger.warning("%s doesn't contain attr %s", self, key)
         return self.attrs.get(key)
 
+    @_cached_property
+    def style(self) -> int:
+        """Retrieves raw style once, shared by the tilable / manageable checks"""
+        return GetWindowLongA(self.handle, GWL_STYLE)
+
+    @_cached_property
+    def exstyle(self) -> int:
+        """Retrieves raw ex-style once, shared by the tilable / manageable checks"""
+        return GetWindowLongA(self.handle, GWL_EXSTYLE)
+
     def get_style(self) -> WindowStyle:
         """Retrieves style
 
         :return: window style
         :rtype: WindowStyle
         """
-        return WindowStyle(user32.GetWindowLongA(self.handle, -16))
+        return WindowStyle(GetWindowLongA(self.handle, GWL_STYLE))
 
     def get_exstyle(self) -> WindowExStyle:
         """Retrieves ex-style
@@ -352,7 +535,7 @@ class Window:
         :return: window ex-style
         :rtype: ExWindowStyle
         """
-        return WindowExStyle(user32.GetWindowLongA(self.handle, -20))
+        return WindowExStyle(GetWindowLongA(self.handle, GWL_EXSTYLE))
 
     def minimize(self):
         """Minimizes the specified window and activates the next top-level window in the Z order."""
@@ -376,20 +559,21 @@ class Window:
 
     def exists(self) -> bool:
         """Check if window exists"""
-        return user32.IsWindow(self.handle)
+        return IsWindow(self.handle)
 
     def get_extended_frame_bounds(self) -> Rect:
         """Retrieves extended frame bounds
 
         Ref: https://learn.microsoft.com/en-us/windows/win32/api/dwmapi/ne-dwmapi-dwmwindowattribute
         """
-        bound = RECT()
-        windll.dwmapi.DwmGetWindowAttribute(
+        bound = _local_buff("rect")
+        if DwmGetWindowAttribute(
             self.handle,
             DwmWindowAttribute.DWMWA_EXTENDED_FRAME_BOUNDS,
-            pointer(bound),
+            byref(bound),
             sizeof(bound),
-        )
+        ):
+            return Rect(0, 0, 0, 0)
         return Rect.from_win_rect(bound)
 
     def get_rect(self) -> Rect:
@@ -402,8 +586,8 @@ class Window:
         :return: a RECT with top/left/bottom/right properties
         :rtype: RECT
         """
-        rect = RECT()
-        if not user32.GetWindowRect(self.handle, pointer(rect)):
+        rect = _local_buff("rect")
+        if not GetWindowRect(self.handle, byref(rect)):
             # raise WinError(get_last_error())
             return Rect(0, 0, 0, 0)
         return Rect.from_win_rect(rect)
@@ -416,7 +600,7 @@ class Window:
         :param rect: RECT with top/left/bottom/right properties
         """
         logger.debug("%s set rect to %s", self, rect)
-        if not user32.SetWindowPos(
+        if not SetWindowPos(
             self.handle,
             None,
             rect.x,
@@ -458,18 +642,18 @@ class Window:
 
     def restrict(self):
         """Restrict the window to the restricted rect"""
-        if self.restricted_actual_rect:
-            logger.debug("%s restricting to %s", self, self.restricted_actual_rect)
-            r1 = self.restricted_actual_rect
-            r2 = self.get_rect()
-            if (
-                r1.left == r2.left
-                and r1.top == r2.top
-                and r1.right == r2.right
-                and r1.bottom == r2.bottom
-            ):
-                return
-            self.set_rect(self.compensated_rect or self.restricted_rect)
+        rect = self.get_restrict_rect()
+        if rect:
+            self.set_rect(rect)
+
+    def get_restrict_rect(self) -> Optional[Rect]:
+        """Retrieves the rect to restore the window to if it has been moved away from
+        the restricted rect, `None` otherwise"""
+        actual_rect = self.restricted_actual_rect
+        if actual_rect and actual_rect != self.get_rect():
+            logger.debug("%s restricting to %s", self, actual_rect)
+            return self.compensated_rect or self.restricted_rect
+        return None
 
     def unrestrict(self):
         """Unrestrict the window"""
@@ -491,57 +675,56 @@ class Window:
         # move cursor to the center of the window
         if cursor_follows:
             rect = self.get_rect()
-            x = rect.left + (rect.right - rect.left) / 2
-            y = rect.top + (rect.bottom - rect.top) / 2
-            user32.SetCursorPos(int(x), int(y))
+            SetCursorPos((rect.left + rect.right) >> 1, (rect.top + rect.bottom) >> 1)
         # activation
         # simple way
-        if user32.SetForegroundWindow(self.handle):
+        if SetForegroundWindow(self.handle):
+            return
+        curr_fore_hwnd = GetForegroundWindow()
+        if curr_fore_hwnd == self.handle:
+            # it is in the foreground already, no need for the input tricks
             return
         # well, simple way didn't work, we have to make our process Foreground
-        our_thread_id = kernel32.GetCurrentThreadId()
+        our_thread_id = GetCurrentThreadId()
         fore_thread_id = None
-        target_thread_id = user32.GetWindowThreadProcessId(self.handle, None)
+        target_thread_id = GetWindowThreadProcessId(self.handle, None)
 
         uf = False  # attached our thread to the fore thread
         ft = False  # attached the fore thread to the target thread
-        curr_fore_hwnd = user32.GetForegroundWindow()
         if curr_fore_hwnd:
-            fore_thread_id = user32.GetWindowThreadProcessId(curr_fore_hwnd, None)
+            fore_thread_id = GetWindowThreadProcessId(curr_fore_hwnd, None)
             if fore_thread_id and fore_thread_id != our_thread_id:
-                uf = user32.AttachThreadInput(our_thread_id, fore_thread_id, True)
+                uf = AttachThreadInput(our_thread_id, fore_thread_id, True)
             if (
                 fore_thread_id
                 and target_thread_id
                 and fore_thread_id != target_thread_id
             ):
-                ft = user32.AttachThreadInput(fore_thread_id, target_thread_id, True)
-        new_fore_window = None
-        retry = 5
-        while new_fore_window != self.handle and retry > 0:
+                ft = AttachThreadInput(fore_thread_id, target_thread_id, True)
+        for attempt in range(ACTIVATE_RETRIES):
+            if attempt:
+                # give the system some time before trying again
+                time.sleep(ACTIVATE_RETRY_INTERVAL)
+            # a single input event makes us the last input process, which is allowed
+            # to set the foreground window
             send_input(
                 INPUT(
                     type=INPUTTYPE.KEYBOARD,
                     ki=KEYBDINPUT(wVk=Vk.MENU, dwFlags=KEYEVENTF.KEYUP),
                 ),
-                INPUT(
-                    type=INPUTTYPE.KEYBOARD,
-                    ki=KEYBDINPUT(wVk=Vk.MENU, dwFlags=KEYEVENTF.KEYUP),
-                ),
             )
-            user32.SetForegroundWindow(self.handle)
-            new_fore_window = user32.GetForegroundWindow()
-            retry -= 1
-            time.sleep(0.01)
+            SetForegroundWindow(self.handle)
+            if GetForegroundWindow() == self.handle:
+                break
         # detach input thread
         if uf:
-            user32.AttachThreadInput(our_thread_id, fore_thread_id, False)
+            AttachThreadInput(our_thread_id, fore_thread_id, False)
         if ft:
-            user32.AttachThreadInput(fore_thread_id, target_thread_id, False)
+            AttachThreadInput(fore_thread_id, target_thread_id, False)
 
     def show_window(self, cmd: ShowWindowCmd):
         """Show window"""
-        user32.ShowWindow(self.handle, cmd)
+        ShowWindow(self.handle, cmd)
 
     def show(self):
         """Shows the window"""
@@ -555,7 +738,7 @@ class Window:
         self.show_window(ShowWindowCmd.SW_HIDE)
         self.off = True
 
-    @cached_property
+    @_cached_property
     def is_root_window(self) -> bool:
         """Check if window is a root window"""
         return not self.parent_handle
@@ -605,34 +788,95 @@ class Window:
         print("is_visible   :", self.is_visible, file=file)
         print("is_iconic    :", self.is_iconic, file=file)
         print("is_restored  :", self.is_restored, file=file)
-        print("unmanageable :", self.unmanageable_reason, file=file)
-        print("untilable    :", self.untilable_reason, file=file)
+        reason = self.unmanageable_reason
+        print("unmanageable :", reason.name if reason else None, file=file)
+        reason = self.untilable_reason
+        print("untilable    :", reason.name if reason else None, file=file)
         print("parent       :", self.parent_handle, file=file)
         print("dpi_awareness:", self.dpi_awareness.name, file=file)
 
 
+_filter_windows_local = threading.local()
+
+
+@WNDENUMPROC
+def _filter_windows_proc(hwnd: HWND, _lparam: LPARAM) -> BOOL:
+    """Shared EnumWindows callback, the filter and result are set per thread"""
+    cb, result = _filter_windows_local.state
+    if cb(hwnd):
+        result.add(hwnd)
+    return True
+
+
 def filter_windows(cb: Callable[[HWND], Any]) -> Set[Any]:
     """Filter app windows of the current desktop"""
     result = set()
-
-    @WINFUNCTYPE(BOOL, HWND, LPARAM)
-    def enum_windows_proc(
-        hwnd: HWND, _lparam: LPARAM
-    ) -> BOOL:  # pylint: disable=invalid-name
-        if cb(hwnd):
-            result.add(hwnd)
-        return True
-
-    if not user32.EnumWindows(enum_windows_proc, None):
-        last_error = get_last_error()
-        if last_error:
-            raise WinError(last_error)
+    # keep the outer state in case the filter enumerates windows by itself
+    outer_state = getattr(_filter_windows_local, "state", None)
+    _filter_windows_local.state = (cb, result)
+    try:
+        if not EnumWindows(_filter_windows_proc, 0):
+            last_error = get_last_error()
+            if last_error:
+                raise WinError(last_error)
+    finally:
+        _filter_windows_local.state = outer_state
     return result
 
 
+def set_windows_rects(windows_rects: List[Tuple[Window, Rect]]):
+    """Sets the rects of multiple windows at once (DeferWindowPos), the system moves
+    them in a single update instead of one by one
+
+    Ref: https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-deferwindowpos
+    """
+    if len(windows_rects) < 2:
+        for window, rect in windows_rects:
+            window.set_rect(rect)
+        return
+    hdwp = BeginDeferWindowPos(len(windows_rects))
+    for window, rect in windows_rects:
+        if not hdwp:
+            break
+        logger.debug("%s set rect to %s", window, rect)
+        hdwp = DeferWindowPos(
+            hdwp,
+            window.handle,
+            None,
+            rect.x,
+            rect.y,
+            rect.width,
+            rect.height,
+            SET_WINDOW_RECT_FLAG,
+        )
+    if not hdwp:
+        # the system has released the batch, move them one by one
+        logger.warning("defer window pos failed: %s", WinError(get_last_error()))
+        for window, rect in windows_rects:
+            window.set_rect(rect)
+        return
+    if not EndDeferWindowPos(hdwp):
+        raise WinError(get_last_error())
+
+
+def filter_windows_mapped(predicate: Callable[[Window], bool]) -> List[Window]:
+    """Filter app windows of the current desktop, the predicate receives the Window
+    built for each handle so it won't have to be built again by the caller"""
+    windows = []
+
+    def check(hwnd: HWND) -> bool:
+        window = Window(hwnd)
+        if predicate(window):
+            windows.append(window)
+        return False
+
+    filter_windows(check)
+    return windows
+
+
 def get_foreground_window() -> Optional[HWND]:
     """Get the foreground window handle"""
-    return user32.GetForegroundWindow()
+    return GetForegroundWindow()
 
 
 def minimize_active_window():
@@ -651,15 +895,18 @@ def toggle_maximize_active_window():
 
 def topo_sort_windows(windows: Iterable[Window]):
     """Sort windows topologicallly"""
+    # read each rect once instead of twice per comparison
+    windows = list(windows)
+    rects = [w.get_rect() for w in windows]
 
-    def cmp(w1: Window, w2: Window) -> int:
-        r1, r2 = w1.get_rect(), w2.get_rect()
+    def cmp(i1: int, i2: int) -> int:
+        r1, r2 = rects[i1], rects[i2]
         if abs(r1.top - r2.top) < 15:
             return r1.left - r2.left
         else:
             return r1.top - r2.top
 
-    return sorted(windows, key=cmp_to_key(cmp))
+    return [windows[i] for i in sorted(range(len(windows)), key=cmp_to_key(cmp))]
 
 
 ###
@@ -676,21 +923,14 @@ if __name__ == "__main__":
             w.set_rect(Rect(0, 0, 800, 600))
             w.show()
         elif action == "exe":
-            for wd in map(
-                Window,
-                filter_windows(
-                    lambda hwnd: Window(hwnd).exe_name.lower() == sys.argv[2].lower()
-                ),
+            exe_name = args[0].lower()
+            for wd in filter_windows_mapped(
+                lambda w: w.exe_name_lower == exe_name
             ):
                 print()
                 wd.inspect()
         elif action == "app":
-            for wd in map(
-                Window,
-                filter_windows(
-                    lambda hwnd: (Window(hwnd).manageable and Window(hwnd).is_visible)
-                ),
-            ):
+            for wd in filter_windows_mapped(lambda w: w.manageable and w.is_visible):
                 print()
                 wd.inspect()
     else:
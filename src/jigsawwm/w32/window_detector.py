@@ -57,8 +57,12 @@ class WindowDetector(ObjectCache, ChangeDetector):
     def current_keys(self) -> set:
         """Retrieve all interested keys at the moment"""
 
+        # runs for every top-level window on each detection, read the known windows
+        # straight from the cache and go through `get_window` only for new ones
+        cached = self.cache.get
+
         def check(hwnd: HWND):
-            w = self.get_window(hwnd)
+            w = cached(hwnd) or self.get_window(hwnd)
             return (w.is_visible or w.off) and w.manageable
 
         return filter_windows(check)
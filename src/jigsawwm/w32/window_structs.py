@@ -139,6 +139,35 @@ class DwmWindowAttribute(enum.IntEnum):
     DWMWA_LAST = 39
 
 
+class Unapplicable(enum.IntEnum):
+    """Reasons why rules can't be applied to a window"""
+
+    NOT_TOPLEVEL = 1
+    CLASSNAME_BLACKLISTED = 2
+    NO_EXE = 3
+    EXE_BLACKLISTED = 4
+    ELEVATED = 5
+
+
+class Unmanageable(enum.IntEnum):
+    """Reasons why a window can't be managed"""
+
+    NOT_APPLICABLE = 1
+    NO_SIZEBOX = 2
+    CLOAKED = 3
+    TRANSPARENT = 4
+
+
+class Untilable(enum.IntEnum):
+    """Reasons why a window can't be tiled"""
+
+    NO_SIZEBOX = 1
+    NO_MAXIMIZEBOX = 2
+    NO_MINIMIZEBOX = 3
+    NOT_ROOT_WINDOW = 4
+    EXE_BLACKLISTED = 5
+
+
 def repr_rect(rect: RECT):
     """Return the string representation of the RECT object."""
     return f"RECT(left={rect.left}, top={rect.top}, right={rect.right}, bottom={rect.bottom})"
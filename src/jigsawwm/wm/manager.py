@@ -28,6 +28,22 @@ from .debug_state import inspect_virtdesk_states
 
 logger = logging.getLogger(__name__)
 
+# the events handled by `handle_window_event`, the hook covers the full range and
+# most of what it receives (i.e. location changes) would be discarded anyway
+HANDLED_WINDOW_EVENTS = frozenset(
+    (
+        WinEvent.EVENT_SYSTEM_FOREGROUND,
+        WinEvent.EVENT_OBJECT_HIDE,
+        WinEvent.EVENT_OBJECT_SHOW,
+        WinEvent.EVENT_OBJECT_UNCLOAKED,
+        WinEvent.EVENT_OBJECT_PARENTCHANGE,
+        WinEvent.EVENT_SYSTEM_MOVESIZESTART,
+        WinEvent.EVENT_SYSTEM_MOVESIZEEND,
+        WinEvent.EVENT_SYSTEM_MINIMIZESTART,
+        WinEvent.EVENT_SYSTEM_MINIMIZEEND,
+    )
+)
+
 
 class WindowManager(ThreadWorker):
     """WindowManager detect the monitors/windows state and arrange them dynamically
@@ -98,6 +114,11 @@ class WindowManager(ThreadWorker):
         _id_evt_thread: DWORD,
         _evt_time: DWORD,
     ):
+        # any event would do to notice the mouse button release after dragging
+        if not self._wait_mouse_released and (
+            not hwnd or event not in HANDLED_WINDOW_EVENTS
+        ):
+            return
         self.enqueue(self.on_window_event, event, hwnd, time.time())
 
     def uninstall_hooks(self):
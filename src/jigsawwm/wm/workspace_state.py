@@ -3,7 +3,7 @@
 import logging
 from typing import List, Optional, Set, Tuple, Iterator
 
-from jigsawwm.w32.window import Window, Rect
+from jigsawwm.w32.window import Window, Rect, set_windows_rects
 from jigsawwm.w32.monitor import get_cursor_pos
 
 from .theme import Theme
@@ -209,9 +209,14 @@ class WorkspaceState:
         logger.debug("%s restrict total %d windows", self, len(self.tiling_windows))
         if not self.theme.strict:
             return
+        # move the displaced windows back in one go
+        windows_rects = []
         for window in self.tiling_windows:
             if window:
-                window.restrict()
+                rect = window.get_restrict_rect()
+                if rect:
+                    windows_rects.append((window, rect))
+        set_windows_rects(windows_rects)
 
     def tiling_index_from_cursor(self) -> int:
         """Get the index of the tiling area under the cursor"""
@@ -227,10 +232,12 @@ class WorkspaceState:
             return
         if self.last_active_window is None:
             self.last_active_window = self.tiling_windows[0]
-        elif self.last_active_window not in self.tiling_windows:
+        # a single scan for both the membership and the position
+        try:
+            i = self.tiling_windows.index(self.last_active_window)
+        except ValueError:
             self.last_active_window.activate()
             return
-        i = self.tiling_windows.index(self.last_active_window)
         i = (i + delta) % len(self.tiling_windows)
         self.last_active_window = self.tiling_windows[i]
         self.last_active_window.activate()
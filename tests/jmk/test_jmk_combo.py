@@ -1,6 +1,7 @@
 """Test jigsawwm.jmk.hotkey module."""
 
 from jigsawwm.jmk.combo import JmkCombos, JmkEvent, Vk
+from jigsawwm.w32.vk import expand_combination, expanded_combinations
 
 
 def test_combos(mocker):
@@ -25,3 +26,30 @@ def test_combos(mocker):
     assert release_cb1.call_count == 0
     combs(JmkEvent(Vk.LBUTTON, False))
     assert release_cb1.call_count == 1
+
+
+def test_expand_combination_modifiers():
+    """Test modifier aliases are expanded to their left and right variants."""
+    assert set(expand_combination([Vk.WIN, Vk.A])) == {
+        (Vk.LWIN, Vk.A),
+        (Vk.RWIN, Vk.A),
+    }
+    assert set(expand_combination([Vk.CONTROL, Vk.SHIFT, Vk.S])) == {
+        (Vk.LCONTROL, Vk.LSHIFT, Vk.S),
+        (Vk.LCONTROL, Vk.RSHIFT, Vk.S),
+        (Vk.RCONTROL, Vk.LSHIFT, Vk.S),
+        (Vk.RCONTROL, Vk.RSHIFT, Vk.S),
+    }
+    assert list(expand_combination([Vk.LWIN, Vk.A])) == [(Vk.LWIN, Vk.A)]
+
+
+def test_expand_combination_mixed():
+    """Test aliases after the first key without expansions are kept as they are."""
+    assert set(expand_combination([Vk.WIN, Vk.LMENU, Vk.CONTROL, Vk.A])) == {
+        (Vk.LWIN, Vk.LMENU, Vk.CONTROL, Vk.A),
+        (Vk.RWIN, Vk.LMENU, Vk.CONTROL, Vk.A),
+    }
+    assert list(expand_combination([Vk.A, Vk.CONTROL])) == [(Vk.A, Vk.CONTROL)]
+    assert expanded_combinations([Vk.CONTROL, Vk.S]) == frozenset(
+        {(Vk.LCONTROL, Vk.S), (Vk.RCONTROL, Vk.S)}
+    )
@@ -50,6 +50,29 @@ def test_jmk_sysin_disable_for_admin_windows(mocker):
     assert sysin.enqueue.call_count == 1
 
 
+def test_jmk_sysin_bypass_exe_case_insensitive(mocker):
+    """Test system input handler bypasses exe names regardless of their case."""
+    window_detector = WindowDetector()
+    sysin = SystemInput(bypass_exe={"MyApp.EXE"}, window_cache=window_detector)
+    sysin.pipe(mocker.Mock())
+    for exe_name in ("myapp.exe", "SNIPASTE.exe", "TextInputHost.exe"):
+        window = Window(123)
+        window.is_elevated = False
+        window.exe_name = exe_name
+        window_detector.get_window = mocker.Mock(return_value=window)
+        sysin.disabled = False
+        sysin.on_focus_changed(123)
+        assert sysin.disabled is True, exe_name
+    # not bypassed
+    window = Window(456)
+    window.is_elevated = False
+    window.exe_name = "whatever.exe"
+    window_detector.get_window = mocker.Mock(return_value=window)
+    sysin.on_system_resumed = mocker.Mock()
+    sysin.on_focus_changed(456)
+    assert sysin.disabled is False
+
+
 def test_jmk_sysout_state(mocker):
     """Test jigsawwm.jmk.sysinout.state."""
     sysout = SystemOutput()
@@ -11,3 +11,10 @@ def test_full_rect(mocker):
         mocker.Mock(get_rect=lambda: Rect(-800, -100, 0, 600)),
     ]
     assert md.refresh_full_rect() == Rect(-800, -100, 1920, 1080)
+
+
+def test_full_rect_without_monitors():
+    """Test the refresh_full_rect method when no monitor is attached"""
+    md = MonitorDetector()
+    md.monitors = []
+    assert md.refresh_full_rect() == Rect(0, 0, 0, 0)
@@ -0,0 +1,47 @@
+"""Test w32.process."""
+
+from jigsawwm.w32 import process
+
+
+def test_is_any_exe_running_nameonly(mocker):
+    """Test executable names are matched case-insensitively against process names."""
+    mocker.patch(
+        "jigsawwm.w32.process._iter_process_basenames",
+        return_value=iter([(4, "System"), (100, "Explorer.EXE"), (200, "code.exe")]),
+    )
+    assert process.is_any_exe_running(
+        ["explorer.exe", "Code.exe", "notepad.exe"]
+    ) == {"explorer.exe", "Code.exe"}
+
+
+def test_is_any_exe_running_fullpath(mocker):
+    """Test full paths are compared case-insensitively, only for matched names."""
+    mocker.patch(
+        "jigsawwm.w32.process._iter_process_basenames",
+        return_value=iter([(100, "Explorer.EXE"), (200, "code.exe")]),
+    )
+    get_exepath = mocker.patch(
+        "jigsawwm.w32.process.get_exepath",
+        side_effect={100: "C:/Windows/Explorer.EXE", 200: "D:/code.exe"}.get,
+    )
+    assert process.is_any_exe_running(
+        ["c:/windows/explorer.exe", "C:/Tools/code.exe", "notepad.exe"],
+        nameonly=False,
+    ) == {"c:/windows/explorer.exe"}
+    assert get_exepath.call_count == 2
+
+
+def test_get_exepath_and_elevation_without_pid(mocker):
+    """Test a missing pid resolves to an empty path without opening any process."""
+    open_process = mocker.patch("jigsawwm.w32.process.open_process_for_limited_query")
+    assert process.get_exepath_and_elevation(0) == ("", True)
+    assert process.get_exepath_and_elevation(None) == ("", True)
+    open_process.assert_not_called()
+
+
+def test_get_exepath_and_elevation_unopenable(mocker):
+    """Test a process that can't be opened is treated like `get_exepath`/`is_elevated`."""
+    mocker.patch(
+        "jigsawwm.w32.process.open_process_for_limited_query", side_effect=OSError
+    )
+    assert process.get_exepath_and_elevation(1234) == ("", True)
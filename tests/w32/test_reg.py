@@ -0,0 +1,78 @@
+"""Test w32.reg.RegValueWatcher"""
+
+from jigsawwm.w32 import reg
+
+
+def test_reg_value_watcher(mocker):
+    """Test the value is cached until the key changes, and the watch is re-armed."""
+    patch = "jigsawwm.w32.reg."
+    signaled = [True]  # the event is created signaled
+
+    def wait(_event, _timeout):
+        # auto-reset event
+        was_signaled, signaled[0] = signaled[0], False
+        return reg.WAIT_OBJECT_0 if was_signaled else 0x102  # WAIT_TIMEOUT
+
+    mocker.patch(patch + "CreateEventW", return_value=1)
+    mocker.patch(patch + "WaitForSingleObject", side_effect=wait)
+    notify = mocker.patch(patch + "RegNotifyChangeKeyValue", return_value=0)
+    winreg = mocker.patch(patch + "winreg")
+    winreg.QueryValueEx.return_value = (b"\x01", 3)
+    watcher = reg.RegValueWatcher(1, "subkey", "value")
+    assert watcher.get() == "01"
+    assert watcher.get() == "01"
+    assert winreg.QueryValueEx.call_count == 1
+    assert notify.call_count == 1
+    # the key changed
+    winreg.QueryValueEx.return_value = (b"\x02", 3)
+    signaled[0] = True
+    assert watcher.get() == "02"
+    assert watcher.get() == "02"
+    assert winreg.QueryValueEx.call_count == 2
+    assert notify.call_count == 2
+    winreg.OpenKey.assert_called_once_with(1, "subkey")
+
+
+def test_reg_value_watcher_unable_to_watch(mocker):
+    """Test the value is read every time if the key can't be watched."""
+    patch = "jigsawwm.w32.reg."
+    signaled = [True]
+
+    def wait(_event, _timeout):
+        was_signaled, signaled[0] = signaled[0], False
+        return reg.WAIT_OBJECT_0 if was_signaled else 0x102
+
+    mocker.patch(patch + "CreateEventW", return_value=1)
+    mocker.patch(patch + "WaitForSingleObject", side_effect=wait)
+    mocker.patch(patch + "SetEvent", side_effect=lambda _: signaled.__setitem__(0, True))
+    mocker.patch(patch + "RegNotifyChangeKeyValue", return_value=5)
+    winreg = mocker.patch(patch + "winreg")
+    winreg.QueryValueEx.return_value = (b"\x01", 3)
+    watcher = reg.RegValueWatcher(1, "subkey", "value")
+    assert watcher.get() == "01"
+    assert watcher.get() == "01"
+    assert winreg.QueryValueEx.call_count == 2
+
+
+def test_reg_value_watcher_missing_value(mocker):
+    """Test a missing key or value is retried with a new handle on the next call."""
+    patch = "jigsawwm.w32.reg."
+    signaled = [True]
+
+    def wait(_event, _timeout):
+        was_signaled, signaled[0] = signaled[0], False
+        return reg.WAIT_OBJECT_0 if was_signaled else 0x102
+
+    mocker.patch(patch + "CreateEventW", return_value=1)
+    mocker.patch(patch + "WaitForSingleObject", side_effect=wait)
+    mocker.patch(patch + "SetEvent", side_effect=lambda _: signaled.__setitem__(0, True))
+    mocker.patch(patch + "RegNotifyChangeKeyValue", return_value=0)
+    winreg = mocker.patch(patch + "winreg")
+    winreg.QueryValueEx.side_effect = FileNotFoundError
+    watcher = reg.RegValueWatcher(1, "subkey", "value")
+    assert watcher.get() is None
+    winreg.OpenKey.return_value.Close.assert_called_once()
+    winreg.QueryValueEx.side_effect = None
+    winreg.QueryValueEx.return_value = (b"\x01", 3)
+    assert watcher.get() == "01"
+    assert winreg.OpenKey.call_count == 2
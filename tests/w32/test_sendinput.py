@@ -0,0 +1,69 @@
+"""Test w32.sendinput"""
+
+from jigsawwm.w32 import sendinput
+from jigsawwm.w32.sendinput import (
+    INPUT,
+    INPUTTYPE,
+    KEYBDINPUT,
+    is_synthesized,
+    send_input,
+    set_synthesized_flag,
+)
+from jigsawwm.w32.vk import Vk
+
+
+def test_set_synthesized_flag(mocker):
+    """Test a new flag is stamped by send_input and checked by is_synthesized."""
+    patch = "jigsawwm.w32.sendinput."
+    # restore the original flag once done
+    mocker.patch(patch + "SYNTHESIZED_FLAG", sendinput.SYNTHESIZED_FLAG)
+    mocker.patch(patch + "GetKeyboardLayout", return_value=1)
+    mocker.patch(patch + "MapVirtualKeyW", return_value=30)
+    stamped = []
+    mocker.patch(
+        patch + "SendInput",
+        side_effect=lambda length, buff, _size: stamped.extend(
+            buff[i].ki.dwExtraInfo for i in range(length)
+        )
+        or length,
+    )
+    set_synthesized_flag(0b1010 << 8)
+    send_input(
+        INPUT(type=INPUTTYPE.KEYBOARD, ki=KEYBDINPUT(wVk=Vk.A)),
+        INPUT(type=INPUTTYPE.KEYBOARD, ki=KEYBDINPUT(wVk=Vk.A, dwFlags=2)),
+        extra=1,
+    )
+    assert stamped == [0b1010 << 8 | 1] * 2
+    assert is_synthesized(KEYBDINPUT(dwExtraInfo=0b1010 << 8 | 1))
+    set_synthesized_flag(0b0101 << 8)
+    assert not is_synthesized(KEYBDINPUT(dwExtraInfo=0b1010 << 8 | 1))
+    assert is_synthesized(KEYBDINPUT(dwExtraInfo=0b0101 << 8))
+
+
+def test_send_input_single_stamps_a_copy(mocker):
+    """Test a single input is sent as a stamped copy, scan codes follow the layout."""
+    patch = "jigsawwm.w32.sendinput."
+    mocker.patch(patch + "_scan_codes", {})
+    mocker.patch(patch + "_scan_codes_layout", None)
+    layout = [11]
+    mocker.patch(patch + "GetKeyboardLayout", side_effect=lambda _: layout[0])
+    mocker.patch(
+        patch + "MapVirtualKeyW", side_effect=lambda vk, _: vk + layout[0] * 100
+    )
+    sent = []
+    mocker.patch(
+        patch + "SendInput",
+        side_effect=lambda length, buff, _size: sent.extend(
+            (buff[i].ki.wScan, buff[i].ki.dwExtraInfo) for i in range(length)
+        )
+        or length,
+    )
+    key = INPUT(type=INPUTTYPE.KEYBOARD, ki=KEYBDINPUT(wVk=Vk.A))
+    send_input(key)
+    # the keyboard layout is switched
+    layout[0] = 12
+    send_input(key)
+    flag = sendinput.SYNTHESIZED_FLAG
+    assert sent == [(Vk.A + 1100, flag), (Vk.A + 1200, flag)]
+    assert key.ki.wScan == 0
+    assert key.ki.dwExtraInfo == 0
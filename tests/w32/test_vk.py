@@ -0,0 +1,72 @@
+"""Test w32.vk.Vk"""
+
+import copy
+import pickle
+
+import pytest
+
+from jigsawwm.w32.vk import Vk, is_keys_down
+
+
+def test_vk_lookup():
+    """Test members can be looked up by value and by name."""
+    assert Vk(0x41) is Vk.A
+    assert Vk["A"] is Vk.A
+    assert Vk.A == 0x41
+    assert Vk.A.name == "A"
+    assert Vk.A.value == 0x41
+    assert isinstance(Vk.A, int)
+    assert isinstance(Vk.A, Vk)
+    assert Vk.A in Vk
+
+
+def test_vk_invalid():
+    """Test looking up an unknown value or name fails the way `enum` does."""
+    with pytest.raises(ValueError):
+        Vk(0x0A)
+    with pytest.raises(KeyError):
+        Vk["NOT_A_KEY"]  # pylint: disable=pointless-statement
+
+
+def test_vk_aliases():
+    """Test duplicated values are aliases of the first member."""
+    assert Vk.LCTRL is Vk.LCONTROL
+    assert Vk["CTRL"] is Vk.CONTROL
+    assert Vk(Vk.LSUPER.value) is Vk.LWIN
+    assert Vk.LCTRL.name == "LCONTROL"
+    assert "LCTRL" in Vk.__members__
+    assert len(Vk) == len(list(Vk))
+    assert "LCTRL" not in [vk.name for vk in Vk]
+
+
+def test_vk_identity():
+    """Test pickling and copying preserve the member identity."""
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(Vk.A, protocol)) is Vk.A
+        assert pickle.loads(pickle.dumps(Vk.LCTRL, protocol)) is Vk.LCONTROL
+    assert copy.copy(Vk.A) is Vk.A
+    assert copy.deepcopy(Vk.A) is Vk.A
+    assert {Vk.A: 1}[0x41] == 1
+    assert repr(Vk.A) == "<Vk.A: 65>"
+
+
+def test_is_keys_down(mocker):
+    """Test key states are read with a single GetKeyboardState call."""
+    user32 = mocker.patch("jigsawwm.w32.vk._user32")
+
+    def get_keyboard_state(states):
+        states[Vk.LSHIFT] = 0x80
+        states[Vk.A] = 0x01  # toggled, not pressed
+        return True
+
+    user32.GetKeyboardState.side_effect = get_keyboard_state
+    user32.GetKeyState.return_value = -0x8000
+    assert is_keys_down([Vk.LSHIFT, Vk.A, Vk.B, Vk.WHEEL_UP]) == {
+        Vk.LSHIFT: True,
+        Vk.A: False,
+        Vk.B: False,
+        Vk.WHEEL_UP: True,
+    }
+    assert user32.GetKeyboardState.call_count == 1
+    # codes beyond the keyboard state array fall back to GetKeyState
+    user32.GetKeyState.assert_called_once_with(Vk.WHEEL_UP)
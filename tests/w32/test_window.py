@@ -1,6 +1,13 @@
 """Test w32.window."""
 
-from jigsawwm.w32.window import Window, topo_sort_windows, Rect
+from jigsawwm.w32.window import (
+    ACTIVATE_RETRIES,
+    ACTIVATE_RETRY_INTERVAL,
+    Window,
+    set_windows_rects,
+    topo_sort_windows,
+    Rect,
+)
 
 
 def test_topo_sort_windows(mocker):
@@ -16,3 +23,107 @@ def test_topo_sort_windows(mocker):
     assert topo_sort_windows([w3, w1, w2]) == [w1, w2, w3]
     assert topo_sort_windows([w1, w3, w2]) == [w1, w2, w3]
     assert topo_sort_windows([w2, w3, w1]) == [w1, w2, w3]
+
+
+def test_window_reads_lazily(mocker):
+    """Test a Window makes no system call until its process or parent is read."""
+    patch = "jigsawwm.w32.window."
+    get_pid = mocker.patch(patch + "GetWindowThreadProcessId")
+    is_toplevel = mocker.patch(patch + "IsTopLevelWindow", return_value=1)
+    get_parent = mocker.patch(patch + "GetParent", return_value=None)
+    w = Window(1)
+    get_pid.assert_not_called()
+    is_toplevel.assert_not_called()
+    get_parent.assert_not_called()
+    assert w.is_toplevel
+    assert w.is_root_window
+    assert w.parent_handle is None
+    is_toplevel.assert_called_once_with(1)
+    get_parent.assert_called_once_with(1)
+    get_pid.assert_not_called()
+
+
+def test_set_windows_rects_deferred(mocker):
+    """Test windows are moved in a single DeferWindowPos batch."""
+    patch = "jigsawwm.w32.window."
+    mocker.patch(patch + "BeginDeferWindowPos", return_value=10)
+    defer_window_pos = mocker.patch(
+        patch + "DeferWindowPos", side_effect=lambda hdwp, *_args: hdwp
+    )
+    end_defer_window_pos = mocker.patch(patch + "EndDeferWindowPos", return_value=True)
+    set_rect = mocker.patch(patch + "Window.set_rect")
+    windows_rects = [(Window(i), Rect(i, i, 100, 100)) for i in range(1, 4)]
+    set_windows_rects(windows_rects)
+    assert defer_window_pos.call_count == 3
+    end_defer_window_pos.assert_called_once_with(10)
+    set_rect.assert_not_called()
+
+
+def test_set_windows_rects_begin_failed(mocker):
+    """Test windows are moved one by one when the batch can't be started."""
+    patch = "jigsawwm.w32.window."
+    mocker.patch(patch + "BeginDeferWindowPos", return_value=None)
+    defer_window_pos = mocker.patch(patch + "DeferWindowPos")
+    end_defer_window_pos = mocker.patch(patch + "EndDeferWindowPos")
+    set_rect = mocker.patch(patch + "Window.set_rect")
+    windows_rects = [(Window(i), Rect(i, i, 100, 100)) for i in range(1, 4)]
+    set_windows_rects(windows_rects)
+    defer_window_pos.assert_not_called()
+    end_defer_window_pos.assert_not_called()
+    assert [c.args for c in set_rect.call_args_list] == [
+        (rect,) for _, rect in windows_rects
+    ]
+
+
+def test_set_windows_rects_defer_failed(mocker):
+    """Test all windows are moved one by one when the batch fails half way."""
+    patch = "jigsawwm.w32.window."
+    mocker.patch(patch + "BeginDeferWindowPos", return_value=10)
+    # the batch is released by the system when deferring the second window
+    defer_window_pos = mocker.patch(
+        patch + "DeferWindowPos",
+        side_effect=lambda hdwp, hwnd, *_args: hdwp if hwnd < 2 else None,
+    )
+    end_defer_window_pos = mocker.patch(patch + "EndDeferWindowPos")
+    set_rect = mocker.patch(patch + "Window.set_rect")
+    windows_rects = [(Window(i), Rect(i, i, 100, 100)) for i in range(1, 4)]
+    set_windows_rects(windows_rects)
+    assert defer_window_pos.call_count == 2
+    end_defer_window_pos.assert_not_called()
+    assert [c.args for c in set_rect.call_args_list] == [
+        (rect,) for _, rect in windows_rects
+    ]
+
+
+def test_activate_retries_with_interval(mocker):
+    """Test activation retries with a fixed interval when the window won't come to front."""
+    patch = "jigsawwm.w32.window."
+    mocker.patch(patch + "SetForegroundWindow", return_value=0)
+    mocker.patch(patch + "GetForegroundWindow", return_value=2)
+    mocker.patch(patch + "GetCurrentThreadId", return_value=10)
+    mocker.patch(patch + "GetWindowThreadProcessId", return_value=10)
+    mocker.patch(patch + "AttachThreadInput", return_value=0)
+    send_input = mocker.patch(patch + "send_input")
+    sleep = mocker.patch(patch + "time.sleep")
+    w = Window(1)
+    w.activate(cursor_follows=False)
+    # one plain attempt, then the retries, each one with an input event
+    assert send_input.call_count == ACTIVATE_RETRIES
+    assert sleep.call_count == ACTIVATE_RETRIES - 1
+    assert all(c.args == (ACTIVATE_RETRY_INTERVAL,) for c in sleep.call_args_list)
+
+
+def test_activate_stops_retrying_once_in_front(mocker):
+    """Test activation stops retrying as soon as the window is in the foreground."""
+    patch = "jigsawwm.w32.window."
+    mocker.patch(patch + "SetForegroundWindow", return_value=0)
+    mocker.patch(patch + "GetForegroundWindow", side_effect=[2, 2, 1])
+    mocker.patch(patch + "GetCurrentThreadId", return_value=10)
+    mocker.patch(patch + "GetWindowThreadProcessId", return_value=10)
+    mocker.patch(patch + "AttachThreadInput", return_value=0)
+    send_input = mocker.patch(patch + "send_input")
+    sleep = mocker.patch(patch + "time.sleep")
+    w = Window(1)
+    w.activate(cursor_follows=False)
+    assert send_input.call_count == 2
+    assert sleep.call_count == 1